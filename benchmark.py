@@ -0,0 +1,175 @@
+from scanner import *
+from load import load_train_data
+from model import Preprocessor
+import ast
+import gc
+import legacy_scanner
+import time
+import tracemalloc
+
+data_types = ['int', 'float', 'str', 'bool']   # Data types used by the synthetic Models and Controllers
+
+def generate_source_code(classes=10, methods=10, arguments=2, asserts=1):
+    """
+    Generates synthetic source code following the MVC architecture (Models and Controllers only).
+
+    Param:
+
+    - classes (int): The number of Model/Controller pairs. Default value is 10.
+    - methods (int): The number of methods of each Controller (each Model has the same number of attributes). Default value is 10.
+    - arguments (int): The number of arguments of each Controller method. Default value is 2.
+    - asserts (int): The number of assertions of each Controller method (at most one per argument). Default value is 1.
+
+    Return:
+
+    - source_code (str): The generated source code.
+    """
+    lines = []
+    for i in range(classes):
+
+        # The Model has one attribute per Controller method, with its getter.
+
+        attributes = [('attr_' + str(j), data_types[j % len(data_types)]) for j in range(methods)]
+        lines.append('class Model' + str(i) + ':')
+        lines.append('    def __init__(self, ' + ', '.join(n + ': ' + t for n, t in attributes) + '):')
+        for name, _ in attributes:
+            lines.append('        self.' + name + ' = ' + name)
+        if not attributes:
+            lines.append('        pass')
+        for name, _type in attributes:
+            lines.append('')
+            lines.append('    def get_' + name + '(self) -> ' + _type + ':')
+            lines.append('        return self.' + name)
+        lines.append('')
+
+        # The Controller receives the Model in its constructor and each method returns one of its attributes.
+
+        lines.append('class Controller' + str(i) + ':')
+        lines.append('    def __init__(self, model: Model' + str(i) + '):')
+        lines.append('        self.model = model')
+        for j in range(methods):
+            values = [('value_' + str(k), data_types[(j + k) % len(data_types)]) for k in range(arguments)]
+            lines.append('')
+            lines.append('    def method_' + str(j) + '(self' + ''.join(', ' + n + ': ' + t for n, t in values) + ') -> '
+                         + attributes[j][1] + ':')
+            for name, _type in values[:asserts]:
+                if _type in ['int', 'float']:
+                    lines.append('        assert 0 <= ' + name + ' <= 100')
+                elif _type == 'str':
+                    lines.append('        assert ' + name + " in ['first', 'second', 'third']")
+            lines.append('        return self.model.get_' + attributes[j][0] + '()')
+        lines.append('')
+    return '\n'.join(lines) + '\n'
+
+def benchmark_traversal(sizes=(10, 50, 250), repeat=5):
+    """
+    Compares the throughput (syntax tree nodes per second) of SampleVisitor with the recursive walk function of the
+    original scanner (see legacy_scanner), printing one line per input size. Both traverse the tree and extract the
+    samples, each one with its own sample extraction (the table of the test dataset is not built).
+
+    Param:
+
+    - sizes (tuple): The numbers of Model/Controller pairs of the synthetic inputs. Default value is (10, 50, 250).
+    - repeat (int): The number of runs of each traversal (the best one is reported). Default value is 5.
+    """
+    print(f"{'Classes':>8} {'Nodes':>9} {'walk (nodes/s)':>16} {'SampleVisitor (nodes/s)':>24} {'Speedup':>8}")
+    for size in sizes:
+        tree = ast.parse(generate_source_code(classes=size))
+        nodes = sum(1 for _ in ast.walk(tree))
+        walk_time = min(measure(lambda: legacy_scanner.walk(tree, '', False, False, [])) for _ in range(repeat))
+        visitor_time = min(measure(lambda: SampleVisitor(SampleBatch()).visit(tree)) for _ in range(repeat))
+        print(f'{size:>8} {nodes:>9} {nodes / walk_time:>16.0f} {nodes / visitor_time:>24.0f} '
+              f'{walk_time / visitor_time:>7.2f}x')
+
+def benchmark_scan(sizes=(10, 50, 250, 1000), methods=10, arguments=2, asserts=1, repeat=3):
+    """
+    Measures how scan() scales with the size of the project, printing one line per input size with the wall time,
+    the peak memory, the throughput (rows of the test dataset per second) and the time per row relative to the
+    smallest size (it should stay close to 1.00 as long as scanning is linear).
+
+    Param:
+
+    - sizes (tuple): The numbers of Model/Controller pairs of the synthetic inputs. Default value is (10, 50, 250, 1000).
+    - methods (int): The number of methods of each Controller. Default value is 10.
+    - arguments (int): The number of arguments of each Controller method. Default value is 2.
+    - asserts (int): The number of assertions of each Controller method. Default value is 1.
+    - repeat (int): The number of runs of each size (the best one is reported). Default value is 3.
+    """
+    print(f"{'Classes':>8} {'Rows':>9} {'Time (s)':>10} {'Peak memory (MB)':>17} {'Rows/s':>10} {'Time/row':>9}")
+    base_time_per_row = None
+    for size in sizes:
+        source_code = generate_source_code(classes=size, methods=methods, arguments=arguments, asserts=asserts)
+        rows = len(scan(source_code))
+        elapsed = min(measure(lambda: scan(source_code)) for _ in range(repeat))
+        peak = measure_peak_memory(lambda: scan(source_code))    # Measured apart, since tracing slows the scan down.
+        time_per_row = elapsed / rows
+        if base_time_per_row is None:
+            base_time_per_row = time_per_row
+        print(f'{size:>8} {rows:>9} {elapsed:>10.3f} {peak / (1 << 20):>17.1f} {rows / elapsed:>10.0f} '
+              f'{time_per_row / base_time_per_row:>8.2f}x')
+
+def benchmark_features(sizes=(10, 100, 1000), repeat=5):
+    """
+    Compares the latency of the feature builders of the preprocessing (Preprocessor.transform, which builds a DataFrame,
+    and Preprocessor.transform_matrix, which builds a float32 NumPy matrix) over the samples of synthetic inputs,
+    printing one line per input size. The preprocessing is fitted with the training dataset of the /data folder.
+
+    Param:
+
+    - sizes (tuple): The numbers of Model/Controller pairs of the synthetic inputs. Default value is (10, 100, 1000).
+    - repeat (int): The number of runs of each feature builder (the best one is reported). Default value is 5.
+    """
+    preprocessor = Preprocessor().fit(load_train_data())
+    print(f"{'Classes':>8} {'Rows':>9} {'DataFrame (ms)':>15} {'Matrix (ms)':>12} {'Speedup':>8}")
+    for size in sizes:
+        test_data = scan(generate_source_code(classes=size))
+        test_data = test_data[test_data['Name'] != '__init__'].reset_index(drop=True)
+        dataframe_time = min(measure(lambda: preprocessor.transform(test_data)) for _ in range(repeat))
+        matrix_time = min(measure(lambda: preprocessor.transform_matrix(test_data)) for _ in range(repeat))
+        print(f'{size:>8} {len(test_data):>9} {dataframe_time * 1000:>15.2f} {matrix_time * 1000:>12.2f} '
+              f'{dataframe_time / matrix_time:>7.2f}x')
+
+def measure(function):
+    """
+    Measures the time spent running a function.
+
+    Param:
+
+    - function (function): The function to run (without arguments).
+
+    Return:
+
+    - elapsed (float): The time spent (in seconds).
+    """
+    gc.collect()    # Garbage from previous runs must not be collected while measuring.
+    init_time = time.perf_counter()
+    function()
+    return time.perf_counter() - init_time
+
+def measure_peak_memory(function):
+    """
+    Measures the peak memory allocated while running a function.
+
+    Param:
+
+    - function (function): The function to run (without arguments).
+
+    Return:
+
+    - peak (int): The peak memory allocated (in bytes).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+if __name__ == '__main__':
+    benchmark_traversal()
+    print()
+    benchmark_scan()
+    print()
+    benchmark_features()
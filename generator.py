@@ -3,14 +3,14 @@ import pandas as pd
 import re
 import shutil
 
-def generate(main_data, init_data, model_data, main_controller_name, title, about, view_threshold=3):
+def generate(main_data, symbols, model_data, main_controller_name, title, about, view_threshold=3):
     """
     Generates the graphical interface.
 
     Param:
 
     - main_data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
     - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
     - main_controller_name (str): The name of the main Controller.
     - title (str): The title of the application displayed in the main window.
@@ -39,18 +39,18 @@ def generate(main_data, init_data, model_data, main_controller_name, title, abou
     shutil.copy('media/GUIMVCEdit16px.png', 'code/icons/edit.png')
     shutil.copy('media/GUIMVCOthers16px.png', 'code/icons/others.png')
     shutil.copy('media/GUIMVCView16px.png', 'code/icons/view.png')
-    views = create_main_file(init_data, model_data, main_controller_name, view_threshold)
+    views = create_main_file(symbols, model_data, main_controller_name, view_threshold)
     create_utilities_file()
-    create_view_file(main_data, init_data, model_data, main_controller_name, title, about, views, view_threshold)
+    create_view_file(main_data, symbols, model_data, main_controller_name, title, about, views, view_threshold)
 
-def create_main_file(init_data, model_data, main_controller_name, view_threshold=3):
+def create_main_file(symbols, model_data, main_controller_name, view_threshold=3):
     """
     Create the main.py file in the /code folder, which includes the declarations of the Models, Controllers, and Views
     necessary for the overall operation of the MVC architecture.
 
     Param:
 
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
     - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
     - main_controller_name (str): The name of the main Controller.
     - view_threshold (int): The minimum number of Controllers to split the View into multiple Views. Default value is 3.
@@ -62,19 +62,15 @@ def create_main_file(init_data, model_data, main_controller_name, view_threshold
     file_names = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
     file_path = os.path.join('code', 'main.py')
     models = {}
-    for index, row in init_data[init_data['UsedByView'] == True].iterrows():    # For each Controller constructor.
-        i = 0
-        while i < 10 and row['ArgumentName' + str(i + 1)] != '': # For each argument declare the required Models.
-            aux_model_data = init_data[init_data['UsedByView'] == False]
-            model_index = aux_model_data[aux_model_data['ClassName'] == row['ArgumentType' + str(i + 1)]].index.to_list()[0]
-            model_key = row['ArgumentName' + str(i + 1)] + ',' + row['ArgumentType' + str(i + 1)]
+    for controller in symbols.get_controllers():    # For each Controller constructor.
+        for name, _type in symbols.constructors[controller].items():  # For each argument declare the required Models.
+            model_key = name + ',' + _type
             models[model_key] = []
-            j = 0
-            while j < 10 and init_data.loc[model_index, 'ArgumentName' + str(j + 1)] != '':
+            for model_argument_type in symbols.constructors[_type].values():
 
                 # According to its type, declare a default value.
 
-                match init_data.loc[model_index, 'ArgumentType' + str(j + 1)]:
+                match model_argument_type:
                     case 'int':
                         models[model_key].append("0")
                     case 'float':
@@ -93,18 +89,12 @@ def create_main_file(init_data, model_data, main_controller_name, view_threshold
                         models[model_key].append("set()")
                     case 'dict':
                         models[model_key].append("{}")
-                j += 1
-            i += 1
 
     # For each Controller constructor, assign the declared models as arguments to each one.
 
     controllers = {}
-    for index, row in init_data[init_data['UsedByView'] == True].iterrows():
-        controllers[row['ClassName']] = []
-        i = 0
-        while i < 10 and row['ArgumentName' + str(i + 1)] != '':
-            controllers[row['ClassName']].append(row['ArgumentName' + str(i + 1)])
-            i += 1
+    for controller in symbols.get_controllers():
+        controllers[controller] = list(symbols.constructors[controller])
     views = {}
     model_getters_data = model_data[model_data['IsAMethod'] == True]
     if len(controllers) <= view_threshold:  # If the minimum threshold of Controllers is not exceeded, these aredisplayed in the main window.
@@ -293,7 +283,7 @@ def create_utilities_file():
         file.write("\telse:\n")
         file.write("\t\tset_treeview_items_rec(treeview, return_value, empty_str, is_the_root=True)\n")
 
-def create_view_file(main_data, init_data, model_data, main_controller_name, title, about, views, view_threshold=3):
+def create_view_file(main_data, symbols, model_data, main_controller_name, title, about, views, view_threshold=3):
     """
     Create the view.py file in the /code folder, where the classes for each View are defined. The Tk() object is
     declared to begin the construction of the GUI.
@@ -301,7 +291,7 @@ def create_view_file(main_data, init_data, model_data, main_controller_name, tit
     Param:
 
     - main_data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
     - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
     - main_controller_name (str): The name of the main Controller.
     - title (str): The title of the application displayed in the main window.
@@ -327,7 +317,7 @@ def create_view_file(main_data, init_data, model_data, main_controller_name, tit
         for k in range(1, len(views)):
             file.write("root_" + str(k) + " = None\n")
         for row in main_data[main_data['Widget'] == "Menubutton"].itertuples():
-            if row.ArgumentName1 != '' or row.ReturnValueName1 != '':
+            if row.ArgumentNames or row.ReturnValueNames:
                 file.write("root_menu_" + str(row.Index) + " = None\n")
         method_data = main_data[main_data['IsAMethod'] == True]
         for row in method_data[method_data['Window'] == True].itertuples():
@@ -363,7 +353,7 @@ def create_view_file(main_data, init_data, model_data, main_controller_name, tit
 
         # Sets the Model attributes to be displayed in the main window (main Controller).
 
-        model_attr, i, x, y = set_model_attr_labels(file, main_data, init_data, model_data, main_controller_name, i, x, y, "self.root")
+        model_attr, i, x, y = set_model_attr_labels(file, main_data, symbols, model_data, main_controller_name, i, x, y, "self.root")
         create_menu(file, main_data, model_data, main_controller_name, about, views, model_attr)    # Creates the main window menu.
 
         # Main controller LabelFrame.
@@ -483,7 +473,7 @@ def create_view_file(main_data, init_data, model_data, main_controller_name, tit
 
                 # Sets the Model attributes to be displayed in the actual window.
 
-                model_attr, i, x, y = set_model_attr_labels(file, main_data, init_data, model_data,
+                model_attr, i, x, y = set_model_attr_labels(file, main_data, symbols, model_data,
                                                             ''.join(word.capitalize() for word in views['View' + chr(66 + actual_view)][0].split('_')),
                                                             i, x, y, "root_" + str(actual_view + 1))
 
@@ -586,11 +576,11 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
     # If methods with no arguments/return values exist in the main Controller, they are added as File menu buttons.
 
     menubutton_data = main_data[main_data['Widget'] == 'Menubutton']
-    menubutton_data = menubutton_data[menubutton_data['ArgumentName1'] == '']
-    for index, row in menubutton_data[menubutton_data['ReturnValueName1'] == ''].iterrows():
+    menubutton_data = menubutton_data[menubutton_data['ArgumentNames'].map(len) == 0]
+    for index, row in menubutton_data[menubutton_data['ReturnValueNames'].map(len) == 0].iterrows():
         file.write("\t\tfile.add_command(label='" + row['WidgetLabel'] + "', command=lambda:self." +
                    convert_to_camel_case(row['ClassName']).lower().replace(' ', '_') + "." + row['Name'] + "())\n")
-    if not menubutton_data[menubutton_data['ReturnValueName1'] == ''].empty:
+    if not menubutton_data[menubutton_data['ReturnValueNames'].map(len) == 0].empty:
         file.write("\t\tfile.add_separator()\n")
     file.write("\t\tfile.add_command(label='") # Exit button is added to File menu.
     match main_data['LanguageID'].mode()[0]:
@@ -602,7 +592,7 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
             file.write("Sortir")
     file.write("', command=self.root.quit)\n")
     menubutton_data = main_data[main_data['Widget'] == 'Menubutton']
-    menubutton_data = menubutton_data[menubutton_data['ArgumentName1'] != '']
+    menubutton_data = menubutton_data[menubutton_data['ArgumentNames'].map(len) > 0]
 
     # Sets Edit menu button.
 
@@ -613,12 +603,12 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
     if len(views) > 1:
         for i in range(len(views) - 1):
             aux_data = main_data[main_data['ClassName'] == ''.join(word.capitalize() for word in views['View' + chr(66 + i)][0].split('_'))]
-            if aux_data[aux_data['ReturnValueName1'] != ''].empty:
+            if aux_data[aux_data['ReturnValueNames'].map(len) > 0].empty:
                 view_char.append(i)
 
     # If there are methods in the main Controller that do not return any value, they are added to the Edit menu.
 
-    if not menubutton_data[menubutton_data['ReturnValueName1'] == ''].empty or view_char:
+    if not menubutton_data[menubutton_data['ReturnValueNames'].map(len) == 0].empty or view_char:
         file.write("\t\tedit = Menu(menu, tearoff=0)\n")
         file.write("\t\tmenu.add_cascade(label='")
         match main_data['LanguageID'].mode()[0]:
@@ -630,18 +620,18 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
 
         # For each method that does not return a value, a window is created.
 
-        for index, row in menubutton_data[menubutton_data['ReturnValueName1'] == ''].iterrows():
+        for index, row in menubutton_data[menubutton_data['ReturnValueNames'].map(len) == 0].iterrows():
             set_window_widgets(file, main_data, model_data, main_controller_name, 0, model_attr, row, index, True)
             file.write("\n\t\tedit.add_command(label='" + row['WidgetLabel'] + "', command=lambda:trigger_menu_" + str(index) + "())\n")
         if view_char:
-            if not menubutton_data[menubutton_data['ReturnValueName1'] == ''].empty:
+            if not menubutton_data[menubutton_data['ReturnValueNames'].map(len) == 0].empty:
                 file.write("\t\tedit.add_separator()\n")
             for char in view_char:  # Adds the Controller view buttons.
                 file.write("\t\tedit.add_command(label='" + views['View' + chr(66 + char)][0][0].upper()
                            + views['View' + chr(66 + char)][0][1:].replace('_', ' ') +
                            "...', command=lambda:view_" + chr(66 + char).lower() + ".show(self, bold_font, 'icons/edit.png'))\n")
     menubutton_data = main_data[main_data['Widget'] == 'Menubutton']
-    menubutton_data = menubutton_data[menubutton_data['ReturnValueName1'] != '']
+    menubutton_data = menubutton_data[menubutton_data['ReturnValueNames'].map(len) > 0]
 
     # Sets View menu button.
 
@@ -652,12 +642,12 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
     if len(views) > 1:
         for i in range(len(views) - 1):
             aux_data = main_data[main_data['ClassName'] == ''.join(word.capitalize() for word in views['View' + chr(66 + i)][0].split('_'))]
-            if aux_data[aux_data['ArgumentName1'] != ''].empty:
+            if aux_data[aux_data['ArgumentNames'].map(len) > 0].empty:
                 view_char.append(i)
 
     # If there are methods in the main Controller that do not have any arguments, they are added to the View menu.
 
-    if not menubutton_data[menubutton_data['ArgumentName1'] == ''].empty or view_char:
+    if not menubutton_data[menubutton_data['ArgumentNames'].map(len) == 0].empty or view_char:
         file.write("\t\tview = Menu(menu, tearoff=0)\n\t\tmenu.add_cascade(label='")
         match main_data['LanguageID'].mode()[0]:
             case 'en':
@@ -670,18 +660,18 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
 
         # For each method that does not have arguments, a window is created.
 
-        for index, row in menubutton_data[menubutton_data['ArgumentName1'] == ''].iterrows():
+        for index, row in menubutton_data[menubutton_data['ArgumentNames'].map(len) == 0].iterrows():
             set_window_widgets(file, main_data, model_data, main_controller_name, 0, model_attr, row, index, True)
             file.write("\n\t\tview.add_command(label='" + row['WidgetLabel'] + "', command=lambda:trigger_menu_" + str(index) + "())\n")
         if view_char:
-            if not menubutton_data[menubutton_data['ArgumentName1'] == ''].empty:
+            if not menubutton_data[menubutton_data['ArgumentNames'].map(len) == 0].empty:
                 file.write("\t\tview.add_separator()\n")
             for char in view_char:
                 file.write("\t\tview.add_command(label='" + views['View' + chr(66 + char)][0][0].upper()
                            + views['View' + chr(66 + char)][0][1:].replace('_', ' ') +
                            "...', command=lambda:view_" + chr(66 + char).lower() + ".show(self, bold_font, 'icons/view.png'))\n")
     menubutton_data = main_data[main_data['Widget'] == 'Menubutton']
-    menubutton_data = menubutton_data[menubutton_data['ArgumentName1'] != '']
+    menubutton_data = menubutton_data[menubutton_data['ArgumentNames'].map(len) > 0]
 
     # Sets Others menu button.
 
@@ -692,12 +682,12 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
     if len(views) > 1:
         for i in range(len(views) - 1):
             aux_data = main_data[main_data['ClassName'] == ''.join(word.capitalize() for word in views['View' + chr(66 + i)][0].split('_'))]
-            if not aux_data[aux_data['ArgumentName1'] != ''].empty and not aux_data[aux_data['ReturnValueName1'] != ''].empty:
+            if not aux_data[aux_data['ArgumentNames'].map(len) > 0].empty and not aux_data[aux_data['ReturnValueNames'].map(len) > 0].empty:
                 view_char.append(i)
 
     # If there are methods in the main Controller that have arguments/return values, they are added to the Others menu.
 
-    if not menubutton_data[menubutton_data['ReturnValueName1'] != ''].empty or view_char:
+    if not menubutton_data[menubutton_data['ReturnValueNames'].map(len) > 0].empty or view_char:
         file.write("\t\tothers = Menu(menu, tearoff=0)\n\t\tmenu.add_cascade(label='")
         match main_data['LanguageID'].mode()[0]:
             case 'en':
@@ -710,11 +700,11 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
 
         # For each method that has arguments/return values, a window is created.
 
-        for index, row in menubutton_data[menubutton_data['ReturnValueName1'] != ''].iterrows():
+        for index, row in menubutton_data[menubutton_data['ReturnValueNames'].map(len) > 0].iterrows():
             set_window_widgets(file, main_data, model_data, main_controller_name, 0, model_attr, row, index, True)
             file.write("\n\t\tothers.add_command(label='" + row['WidgetLabel'] + "', command=lambda:trigger_menu_" + str(index) + "())\n")
         if view_char:
-            if not menubutton_data[menubutton_data['ReturnValueName1'] != ''].empty:
+            if not menubutton_data[menubutton_data['ReturnValueNames'].map(len) > 0].empty:
                 file.write("\t\tothers.add_separator()\n")
             for char in view_char:
                 file.write("\t\tothers.add_command(label='" + views['View' + chr(66 + char)][0][0].upper()
@@ -740,7 +730,7 @@ def create_menu(file, main_data, model_data, main_controller_name, about, views,
         case 'ca':
             file.write("Sobre...', command=lambda:self.message_box(self.root, 'Sobre...', '" + about + "', 'ca'))\n")
 
-def set_model_attr_labels(file, main_data, init_data, model_data, controller, i, x, y, root):
+def set_model_attr_labels(file, main_data, symbols, model_data, controller, i, x, y, root):
     """
     Sets the Model attributes to display in each View, as long as they exist as sample return values in model_data.
 
@@ -748,7 +738,7 @@ def set_model_attr_labels(file, main_data, init_data, model_data, controller, i,
 
     - file (_io.TextIOWrapper): File input/output reference.
     - main_data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
     - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
     - controller (str): The name of the current Controller.
     - i (int): LabelFrame counter.
@@ -764,23 +754,20 @@ def set_model_attr_labels(file, main_data, init_data, model_data, controller, i,
     - y (int): Grid Y position.
     """
     model_attr = []
-    aux_data = init_data.loc[init_data['ClassName'] == controller]
-    init_aux_data = aux_data.loc[aux_data.index.tolist()[0]]
 
     # For each argument of the Controller constructor, we find the getters of the Models it uses.
 
-    k = 0
-    while init_aux_data['ArgumentName' + str(k + 1)] != '' and k < 10:
-        aux_data = model_data[model_data['ClassName'] == init_aux_data['ArgumentType' + str(k + 1)]]
+    for model_name, model_type in symbols.constructors[controller].items():
+        aux_data = model_data[model_data['ClassName'] == model_type]
         aux_data = aux_data[aux_data['UsedByController'] == controller]
-        aux_data = aux_data[aux_data['ModelName'] == init_aux_data['ArgumentName' + str(k + 1)]]
+        aux_data = aux_data[aux_data['ModelName'] == model_name]
 
         # A LabelFrame is created if return values exist for the Model attributes.
 
         if not aux_data[aux_data['Name'].isin(list(aux_data[aux_data['IsAReturnValue']]['BelongsTo']))].empty:
             x = 0   # Grid X position.
             y = 0   # Grid Y position.
-            frame_title = init_aux_data['ArgumentName' + str(k + 1)][0].upper() + init_aux_data['ArgumentName' + str(k + 1)][1:].replace('_', ' ')
+            frame_title = model_name[0].upper() + model_name[1:].replace('_', ' ')
             file.write("\t\tcont_" + str(i) + " = ttk.LabelFrame(" + root + ", text='" + frame_title + "', style='Bold.TLabelframe')\n")
             file.write("\t\tcont_" + str(i) + ".grid(row=" + str(i) + ", column=0, padx=4, pady=4, sticky='we', columnspan=3)\n")
             file.write("\t\tcont_" + str(i) + ".columnconfigure(0, weight=1)\n")
@@ -803,11 +790,11 @@ def set_model_attr_labels(file, main_data, init_data, model_data, controller, i,
                         file.write("self.")
                     file.write("attr_" + str(index) + " = ttk.Label(cont_" + str(i) + ", text=")
                     if row['Type'] == "bool":
-                        file.write("get_boolean_str(self." + init_aux_data['ArgumentName' + str(k + 1)] + "." + row['BelongsTo'] + "(), '" + main_data['LanguageID'].mode()[0] + "'), foreground=get_boolean_fg(self." + init_aux_data['ArgumentName' + str(k + 1)] +  "." + row['BelongsTo'] + "()), font=bold_font")
+                        file.write("get_boolean_str(self." + model_name + "." + row['BelongsTo'] + "(), '" + main_data['LanguageID'].mode()[0] + "'), foreground=get_boolean_fg(self." + model_name +  "." + row['BelongsTo'] + "()), font=bold_font")
                     elif is_a_password:
-                        file.write("'•' * len(self." + init_aux_data['ArgumentName' + str(k + 1)] + "." + row['BelongsTo'] + "())")
+                        file.write("'•' * len(self." + model_name + "." + row['BelongsTo'] + "())")
                     else:
-                        file.write("self." + init_aux_data['ArgumentName' + str(k + 1)] + "." + row['BelongsTo'] + "()")
+                        file.write("self." + model_name + "." + row['BelongsTo'] + "()")
                     file.write(")\n")
                     file.write("\t\t")
                     if root == "self.root":
@@ -830,10 +817,9 @@ def set_model_attr_labels(file, main_data, init_data, model_data, controller, i,
                     file.write("\t\tset_treeview_items(")
                     if root == "self.root":
                         file.write("self.")
-                    file.write("attr_" + str(index) + ", self." + init_aux_data['ArgumentName' + str(k + 1)] + "." + row['BelongsTo'] + "(), '" +main_data['LanguageID'].mode()[0] + "')\n")
+                    file.write("attr_" + str(index) + ", self." + model_name + "." + row['BelongsTo'] + "(), '" +main_data['LanguageID'].mode()[0] + "')\n")
                     x += 1
                 y = 0
-        k += 1
         i += 1
     return model_attr, i, x, y
 
@@ -1488,7 +1474,6 @@ def create_widgets(file, main_data, model_data, main_controller_name, model_attr
         # Writes the code for the function that calls a method of the Controller.
 
         file.write("\n" + tabulation + "def trigger_button_" + str(index) + "():\n")
-        k = 0
         arguments = []
         mask = argument_data['BelongsTo'].apply(
             lambda z: row['Name'] in [item.strip() for item in z.split(',')]
@@ -1497,9 +1482,8 @@ def create_widgets(file, main_data, model_data, main_controller_name, model_attr
         # Saves the argument indices needed to call the method.
 
         aux_data = argument_data[mask]
-        while row['ArgumentName' + str(k + 1)] != '' and k < 10:
-            arguments.append(aux_data[aux_data['Name'] == row['ArgumentName' + str(k + 1)]].index.tolist()[0])
-            k += 1
+        for argument_name in row['ArgumentNames']:
+            arguments.append(aux_data[aux_data['Name'] == argument_name].index.tolist()[0])
         if arguments:   # If it has arguments, checks that they fulfill the restrictions (written code).
             for k in range(len(arguments)):
                 if main_data.loc[arguments[k], 'Type'] in ['int', 'float'] and argument_data.loc[arguments[k]]['Widget'] == "Spinbox":
@@ -1663,7 +1647,6 @@ def create_widgets(file, main_data, model_data, main_controller_name, model_attr
                             file.write("Valor no vàlid.")
                     file.write("', '" + main_data['LanguageID'].mode()[0] + "')\n" + tabulation + "\t\treturn\n")
         file.write(tabulation + "\t")
-        k = 0
         return_values = []
         mask = return_value_data['BelongsTo'].apply(
             lambda z: row['Name'] in [item.strip() for item in z.split(',')]
@@ -1672,9 +1655,8 @@ def create_widgets(file, main_data, model_data, main_controller_name, model_attr
         # Saves the return value indices needed to call the method.
 
         aux_data = return_value_data[mask]
-        while row['ReturnValueName' + str(k + 1)] != '' and k < 10:
-            return_values.append(aux_data[aux_data['Name'] == row['ReturnValueName' + str(k + 1)]].index.tolist()[0])
-            k += 1
+        for return_value_name in row['ReturnValueNames']:
+            return_values.append(aux_data[aux_data['Name'] == return_value_name].index.tolist()[0])
         if return_values:   # The return variables are written first.
             for k in range(len(return_values)):
                 file.write("ret_" + str(return_values[k]))
@@ -2118,7 +2100,7 @@ def set_window_widgets(file, main_data, model_data, main_controller_name, actual
     aux_data = main_data[main_data['ClassName'] == row['ClassName']]
     method_data = aux_data[aux_data['Name'] == row['Name']]
     argument_and_return_value_data = aux_data[aux_data['BelongsTo'] == row['Name']]
-    if row['ReturnValueName1'] == '':   # Configuration for those methods that do not return any value.
+    if not row['ReturnValueNames']:   # Configuration for those methods that do not return any value.
         file.write("\t\t\ticon_" + str(index) + " = PhotoImage(file='icons/edit.png')\n")  # Icon.
         file.write("\t\t\troot_" + _type + "_" + str(index) + ".iconphoto(False, icon_" + str(index) + ")\n")
         x, y = create_widgets(file, pd.concat([method_data, argument_and_return_value_data]).sort_index(), model_data,
@@ -2156,7 +2138,7 @@ def set_window_widgets(file, main_data, model_data, main_controller_name, actual
         file.write("\t\t\t\troot_" + _type + "_" + str(index) + " = None\n\n")
         file.write(
             "\t\t\troot_" + _type + "_" + str(index) + ".protocol('WM_DELETE_WINDOW', on_close_" + _type + "_" + str(index) + ")\n")'''
-    elif row['ArgumentName1'] == '':    # Configuration for those methods that do not have any arguments.
+    elif not row['ArgumentNames']:    # Configuration for those methods that do not have any arguments.
         file.write("\t\t\ticon_" + str(index) + " = PhotoImage(file='icons/view.png')\n")  # Icon.
         file.write("\t\t\troot_" + _type + "_" + str(index) + ".iconphoto(False, icon_" + str(index) + ")\n")
         x, y = create_widgets(file, pd.concat([method_data, argument_and_return_value_data]).sort_index(), model_data,
@@ -1,6 +1,27 @@
+from concurrent.futures import ProcessPoolExecutor
+from scanner import get_labels, ragged_column
+from predictor import feature_columns, get_feature_hashes
+import hashlib
+import json
 import os
+import shutil
+import time
+import numpy as np
 import pandas as pd
 
+cache_folder = os.path.join(os.getcwd(), 'cache')   # Folder where the binary copies of the loaded files are stored
+generated_files = ['main.py', 'view.py', 'utilities.py']   # Files of the /code folder created by the generator
+parallel_threshold = 4  # Minimum number of data files to parse them in a process pool
+train_store_path = os.path.join(cache_folder, 'train_store.npz')   # Compacted training dataset (see compact_train_data)
+train_store_version = 2   # Increased whenever the format of the compacted training dataset changes
+data_cache_version = 1  # Increased whenever the format of the binary copies of the data files changes
+value_kinds = [str, bool, int, float]   # Types of the values of the text columns kept by encode_columns (str otherwise)
+
+# Fixed data types of the training dataset columns (the remaining ones are kept as objects).
+
+data_types = {'From': 'float64', 'To': 'float64', 'IsAnArgument': 'bool', 'IsAMethod': 'bool', 'IsAReturnValue': 'bool',
+              'UsedByView': 'bool'}
+
 def load_source_code():
     """
     Loads the source code found in the /code folder.
@@ -14,7 +35,20 @@ def load_source_code():
     source_code = merge(folder, file_names)
     return source_code
 
-def merge(folder, file_names, data=False):
+def load_source_files():
+    """
+    Returns the paths of the source code files found in the /code folder, so that each one can be scanned on its own.
+
+    Return:
+
+    - file_paths (list): The sorted list of source code file paths (files created by the generator are excluded).
+    """
+    folder = os.path.join(os.getcwd(), 'code')
+    file_names = sorted(f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f)) and f.endswith('.py'))
+    file_paths = [os.path.join(folder, f) for f in file_names if f not in generated_files]
+    return file_paths
+
+def merge(folder, file_names, data=False, max_workers=None):
     """
     Merge files into a single output format, whether it's the entire source code or training data.
 
@@ -23,6 +57,7 @@ def merge(folder, file_names, data=False):
     - folder (str): The folder where the files are located.
     - file_names (list): List of file names (these can be .py/.xlsx files).
     - data (bool): Indicates whether is data or not (default is False).
+    - max_workers (int): The maximum number of processes used to parse the data files (default is the number of CPUs).
 
     Return:
 
@@ -31,30 +66,433 @@ def merge(folder, file_names, data=False):
     merged = None
     if not data:
         merged = ""
-    else:
-        merged = pd.DataFrame()
-    for file_name in file_names:
-        file_path = os.path.join(folder, file_name)
-        if not data:
-            if os.path.isfile(file_path) and file_name not in ['main.py', 'view.py', 'utilities.py']:
+        for file_name in file_names:
+            file_path = os.path.join(folder, file_name)
+            if os.path.isfile(file_path) and file_name not in generated_files:
                 with open(file_path, "r", encoding="utf-8") as file:
                     merged += file.read()
-        else:
-            if os.path.isfile(file_path):
-                print(file_path)
-                dataframe = pd.read_excel(file_path)
-                merged = pd.concat([merged, dataframe], ignore_index=True)
+    else:
+        file_paths = [os.path.join(folder, f) for f in file_names if os.path.isfile(os.path.join(folder, f))]
+        merged = read_data_files(file_paths, max_workers)
     return merged
 
-def load_train_data():
+def read_data_files(file_paths, max_workers=None):
+    """
+    Reads several training data files, in parallel if there are enough of them, and concatenates them once at the end
+    using a fixed column order and data types. The parse time of each file is reported.
+
+    Param:
+
+    - file_paths (list): List of .xlsx file paths.
+    - max_workers (int): The maximum number of processes used to parse the files (default is the number of CPUs).
+
+    Return:
+
+    - merged (pandas.core.frame.DataFrame): The merged training data.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if len(file_paths) < parallel_threshold or max_workers < 2:    # Few files do not pay the cost of a process pool.
+        results = [timed_read_data_file(file_path) for file_path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            results = list(executor.map(timed_read_data_file, file_paths))
+    columns = get_labels() + ['Widget']
+    dataframes = []
+    for file_path, (dataframe, elapsed) in zip(file_paths, results):
+        print(file_path + " (" + f"{elapsed:.3f}" + " seconds)")
+        dataframes.append(dataframe)
+    if not dataframes:
+        return pd.DataFrame(columns=columns)
+    merged = pd.concat(dataframes, ignore_index=True)
+    return merged.astype({column: data_types.get(column, 'object') for column in columns})
+
+def normalize_data_file(dataframe):
+    """
+    Converts the data contained in a training data file into the fixed column order and data types of the training
+    dataset (see set_ragged_columns).
+
+    Param:
+
+    - dataframe (pandas.core.frame.DataFrame): The data contained in a training data file.
+
+    Return:
+
+    - dataframe (pandas.core.frame.DataFrame): The data with the columns of the training dataset.
+    """
+    columns = get_labels() + ['Widget']
+    dataframe = set_ragged_columns(dataframe).reindex(columns=columns)
+    return dataframe.astype({column: data_types.get(column, 'object') for column in columns})
+
+def set_ragged_columns(dataframe):
+    """
+    Converts the ArgumentName<N>/ArgumentType<N> and ReturnValueName<N>/ReturnValueType<N> columns (N = 1..10) of the
+    training data files into the ArgumentNames/ArgumentTypes and ReturnValueNames/ReturnValueTypes tuple columns used by
+    the scanner.
+
+    Param:
+
+    - dataframe (pandas.core.frame.DataFrame): The data contained in a training data file.
+
+    Return:
+
+    - dataframe (pandas.core.frame.DataFrame): The data with the tuple columns instead of the numbered ones.
+    """
+    for prefix in ['Argument', 'ReturnValue']:
+        numbers = sorted(int(column[len(prefix + 'Name'):]) for column in dataframe.columns
+                         if column.startswith(prefix + 'Name') and column[len(prefix + 'Name'):].isdigit())
+        if not numbers:
+            continue
+        name_columns = [prefix + 'Name' + str(number) for number in numbers]
+        type_columns = [prefix + 'Type' + str(number) for number in numbers]
+        names = []
+        types = []
+
+        # Blank cells (empty or NaN) mark the end of the names of each sample.
+
+        for row_names, row_types in zip(dataframe[name_columns].itertuples(index=False),
+                                        dataframe[type_columns].itertuples(index=False)):
+            size = 0
+            while size < len(row_names) and isinstance(row_names[size], str) and row_names[size] != '':
+                size += 1
+            names.append(tuple(row_names[:size]))
+            types.append(tuple(str(_type) for _type in row_types[:size]))
+        dataframe = dataframe.drop(columns=name_columns + type_columns)
+        dataframe[prefix + 'Names'] = pd.Series(names, index=dataframe.index, dtype=object)
+        dataframe[prefix + 'Types'] = pd.Series(types, index=dataframe.index, dtype=object)
+    return dataframe
+
+def timed_read_data_file(file_path):
+    """
+    Reads a training data file measuring the time spent.
+
+    Param:
+
+    - file_path (str): The path of the .xlsx file.
+
+    Return:
+
+    - dataframe (pandas.core.frame.DataFrame): The data contained in the file.
+    - elapsed (float): The time spent reading the file (in seconds).
+    """
+    init_time = time.perf_counter()
+    dataframe = read_data_file(file_path)
+    return dataframe, time.perf_counter() - init_time
+
+def read_data_file(file_path):
+    """
+    Reads a training data file (.xlsx). The first time it is read, a binary copy is saved in the /cache folder (see
+    write_data_cache), which is used in later loads as long as the .xlsx file has not been modified.
+
+    Param:
+
+    - file_path (str): The path of the .xlsx file.
+
+    Return:
+
+    - dataframe (pandas.core.frame.DataFrame): The data contained in the file (see normalize_data_file).
+    """
+    folder = get_data_cache_folder(file_path)
+    info_path = os.path.join(folder, 'info.json')
+    stat = os.stat(file_path)
+    info = {}
+    if os.path.isfile(info_path):
+        try:
+            with open(info_path, "r", encoding="utf-8") as file:
+                info = json.load(file)
+        except ValueError:  # The copy is corrupt, so it is written again.
+            info = {}
+    if info.get('version') != data_cache_version:
+        info = {}
+
+    # If the modification time and size have not changed, the binary copy is still valid. Otherwise, the content hash
+    # decides whether the file really changed (e.g. it has only been copied or touched).
+
+    if info and info.get('mtime') == stat.st_mtime and info.get('size') == stat.st_size:
+        dataframe = read_data_cache(folder)
+        if dataframe is not None:
+            return dataframe
+    digest = get_file_hash(file_path)
+    dataframe = read_data_cache(folder) if info.get('hash') == digest else None
+    info = {'version': data_cache_version, 'mtime': stat.st_mtime, 'size': stat.st_size, 'hash': digest}
+    if dataframe is not None:   # Only the info is updated, since the arrays are mapped.
+        temp_path = info_path + '.tmp'
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(info, file)
+        os.replace(temp_path, info_path)
+        return dataframe
+    dataframe = normalize_data_file(pd.read_excel(file_path))
+    write_data_cache(dataframe, folder, info)
+    return dataframe
+
+def get_data_cache_folder(file_path):
+    """
+    Returns the folder of the binary copy of a training data file, named after the file and the hash of its full path
+    (so files with the same name in different folders do not share it).
+
+    Param:
+
+    - file_path (str): The path of the .xlsx file.
+
+    Return:
+
+    - folder (str): The folder of the binary copy.
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    digest = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_folder, 'data', name + '-' + digest)
+
+def write_data_cache(dataframe, folder, info):
+    """
+    Saves the binary copy of a training data file: one .npy file per array (see encode_columns), so that they can be
+    memory-mapped when read, and the info.json file that tells whether the copy is still valid.
+
+    Param:
+
+    - dataframe (pandas.core.frame.DataFrame): The data contained in the file (see normalize_data_file).
+    - folder (str): The folder of the binary copy (see get_data_cache_folder).
+    - info (dict): The version of the copy, and the modification time, size and content hash of the file.
+    """
+    temp_folder = folder + '.tmp' + str(os.getpid())
+    shutil.rmtree(temp_folder, ignore_errors=True)
+    os.makedirs(temp_folder)
+    for key, array in encode_columns(dataframe).items():
+        np.save(os.path.join(temp_folder, key + '.npy'), array, allow_pickle=False)
+    with open(os.path.join(temp_folder, 'info.json'), "w", encoding="utf-8") as file:
+        json.dump(info, file)
+    shutil.rmtree(folder, ignore_errors=True)
+    os.replace(temp_folder, folder)
+
+def read_data_cache(folder):
+    """
+    Reads the binary copy of a training data file saved by write_data_cache, memory-mapping its arrays.
+
+    Param:
+
+    - folder (str): The folder of the binary copy (see get_data_cache_folder).
+
+    Return:
+
+    - dataframe (pandas.core.frame.DataFrame): The data contained in the file (None if the copy is unreadable).
+    """
+    try:
+        arrays = {file_name[:-len('.npy')]: np.load(os.path.join(folder, file_name), mmap_mode='r', allow_pickle=False)
+                  for file_name in os.listdir(folder) if file_name.endswith('.npy')}
+        return decode_columns(arrays)
+    except (OSError, KeyError, ValueError):
+        return None
+
+def encode_columns(dataframe):
     """
-    Loads the training data found in the /data folder.
+    Converts the columns of a dataset into plain NumPy arrays, which can be saved without pickle. Numeric and boolean
+    columns are kept as they are, text columns are dictionary-encoded (their distinct values as text, with the type of
+    each one, see value_kinds, plus the code of the value of each sample, -1 for blank cells) and tuple columns are
+    flattened (see scanner.ragged_column) and dictionary-encoded too.
+
+    Param:
+
+    - dataframe (pandas.core.frame.DataFrame): The dataset.
 
     Return:
 
-    - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+    - arrays (dict): The arrays (by name), including the names of the columns.
+    """
+    arrays = {'columns': np.array(list(dataframe.columns), dtype=str)}
+    for i, column in enumerate(dataframe.columns):
+        values = dataframe[column]
+        key = str(i)
+        if not (values.dtype == object or pd.api.types.is_string_dtype(values.dtype)):
+            arrays['data_' + key] = values.to_numpy()
+            continue
+        values = values.astype(object)
+        if len(values) and values.map(lambda value: isinstance(value, tuple)).all():
+            lengths = values.map(len).to_numpy(dtype=np.int64)
+            arrays['offsets_' + key] = np.concatenate([[0], np.cumsum(lengths)])
+            values = pd.Series([item for items in values for item in items], dtype=object)
+        codes, uniques = pd.factorize(values)
+        arrays['codes_' + key] = codes.astype(np.int32)
+        arrays['values_' + key] = np.array([str(value) for value in uniques], dtype=str)
+        arrays['kinds_' + key] = np.array([get_value_kind(value) for value in uniques], dtype=np.int8)
+    return arrays
+
+def get_value_kind(value):
     """
+    Returns the type of a value of a text column (see value_kinds).
+
+    Param:
+
+    - value (object): The value.
+
+    Return:
+
+    - kind (int): The position of its type in value_kinds (0, text, if it is not there).
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return value_kinds.index(bool)
+    if isinstance(value, (int, np.integer)):
+        return value_kinds.index(int)
+    if isinstance(value, (float, np.floating)):
+        return value_kinds.index(float)
+    return value_kinds.index(str)
+
+def decode_columns(arrays):
+    """
+    Rebuilds the dataset encoded by encode_columns.
+
+    Param:
+
+    - arrays (dict/numpy.lib.npyio.NpzFile): The arrays (by name).
+
+    Return:
+
+    - dataframe (pandas.core.frame.DataFrame): The dataset.
+    """
+    columns = {}
+    for i, column in enumerate(arrays['columns'].tolist()):
+        key = str(i)
+        if 'data_' + key in arrays:
+            columns[column] = pd.Series(np.asarray(arrays['data_' + key]))
+            continue
+        uniques = [value if kind == 0 else (value == 'True' if value_kinds[kind] is bool else value_kinds[kind](value))
+                   for value, kind in zip(arrays['values_' + key].tolist(), arrays['kinds_' + key].tolist())]
+        values = np.array(uniques + [np.nan], dtype=object)[arrays['codes_' + key]]
+        if 'offsets_' + key in arrays:
+            offsets = np.asarray(arrays['offsets_' + key]).tolist()
+            values = ragged_column(values.tolist(), list(zip(offsets[:-1], offsets[1:])))
+        columns[column] = pd.Series(values, dtype=object)
+    return pd.DataFrame(columns)
+
+def get_file_hash(file_path):
+    """
+    Computes the hash of the content of a file.
+
+    Param:
+
+    - file_path (str): The path of the file.
+
+    Return:
+
+    - digest (str): The SHA-256 hash of the file content (hexadecimal).
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+def load_train_data(max_workers=None, path=train_store_path):
+    """
+    Loads the training data found in the /data folder, compacted (see compact_train_data). The compacted training
+    dataset is stored in a binary file (see write_train_store), which is used in later loads as long as the .xlsx files
+    have not been modified.
+
+    Param:
+
+    - max_workers (int): The maximum number of processes used to parse the data files (default is the number of CPUs).
+    - path (str): The path of the compacted training dataset.
+
+    Return:
+
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset (compacted).
+    """
+    init_time = time.perf_counter()
     folder = os.path.join(os.getcwd(), 'data')
-    file_names = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f)) and f.endswith('.xlsx')]
-    train_data = merge(folder, file_names, True)
-    return train_data
\ No newline at end of file
+    file_names = sorted(f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f)) and f.endswith('.xlsx'))
+    signature = get_train_store_signature(folder, file_names)
+    train_data = read_train_store(path, signature)
+    if train_data is not None:
+        print(path + " (" + f"{time.perf_counter() - init_time:.3f}" + " seconds)")
+        return train_data
+    merged = merge(folder, file_names, True, max_workers)
+    train_data = compact_train_data(merged)
+    write_train_store(train_data, signature, path)
+    print(str(len(merged)) + " samples compacted into " + str(len(train_data)) + " unique samples")
+    return train_data
+
+def compact_train_data(train_data):
+    """
+    Deduplicates the training samples: samples with the same independent variables and widget (see
+    predictor.get_feature_hashes) are merged into the first one, whose Weight column counts them. Constructors are
+    excluded, since they are not used to train the model, and only the columns used by the model are kept (the widget
+    remains the last one).
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset (it may be compacted already).
+
+    Return:
+
+    - compacted (pandas.core.frame.DataFrame): The unique training samples with their weights.
+    """
+    target = train_data.columns[-1]
+    train_data = train_data[train_data['Name'] != '__init__']
+    _, first, inverse = np.unique(get_feature_hashes(train_data), return_index=True, return_inverse=True)
+    weights = np.bincount(inverse.ravel(), weights=train_data['Weight'].to_numpy(dtype=np.float64)
+                          if 'Weight' in train_data.columns else None, minlength=len(first))
+    order = np.argsort(first)   # The unique samples keep the order of the training data files.
+    compacted = train_data.iloc[first[order]][feature_columns + [target]].reset_index(drop=True)
+    compacted.insert(len(feature_columns), 'Weight', weights[order].astype(np.int64))
+    return compacted
+
+def get_train_store_signature(folder, file_names):
+    """
+    Computes the signature of the training data files, which identifies the compacted training dataset built from them.
+
+    Param:
+
+    - folder (str): The folder where the files are located.
+    - file_names (list): List of .xlsx file names.
+
+    Return:
+
+    - signature (str): The signature (the name, size and modification time of each file, as JSON).
+    """
+    files = []
+    for file_name in file_names:
+        stat = os.stat(os.path.join(folder, file_name))
+        files.append([file_name, stat.st_size, stat.st_mtime])
+    return json.dumps([train_store_version, files])
+
+def write_train_store(train_data, signature, path=train_store_path):
+    """
+    Saves the compacted training dataset in a compressed binary file (.npz), with the columns dictionary-encoded (see
+    encode_columns).
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): The compacted training dataset (see compact_train_data).
+    - signature (str): The signature of the training data files (see get_train_store_signature).
+    - path (str): The path of the compacted training dataset.
+    """
+    arrays = encode_columns(train_data)
+    arrays['signature'] = np.array(signature)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, "wb") as file:
+        np.savez_compressed(file, **arrays)
+    os.replace(temp_path, path)
+
+def read_train_store(path, signature):
+    """
+    Reads the compacted training dataset saved by write_train_store.
+
+    Param:
+
+    - path (str): The path of the compacted training dataset.
+    - signature (str): The signature of the current training data files (see get_train_store_signature).
+
+    Return:
+
+    - train_data (pandas.core.frame.DataFrame): The compacted training dataset (None if it is missing, unreadable or
+      built from other files).
+    """
+    try:
+        with np.load(path, allow_pickle=False) as file:
+            if str(file['signature']) != signature:
+                return None
+            return decode_columns(file)
+    except (OSError, KeyError, ValueError):
+        return None
+
+if __name__ == '__main__':  # Compacts the training data files of the /data folder (see load_train_data)
+    load_train_data()
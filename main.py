@@ -1,33 +1,127 @@
 from load import *
 from scanner import *
-from model import *
+from predictor import *   # The model module (and scikit-learn) is only imported to train or evaluate
 from refiner import *
 from generator import *
 from tkinter import *
 from tkinter import ttk
 from tkinter import font
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
+import traceback
 
 train_data = None   # Training dataset
 test_data = None    # Test dataset belonging to the scanned source code
-init_data = None    # Dataset of Model and Controller constructors (methods only)
+symbols = None  # Symbol table of the scanned classes (constructors and Models)
 model_data = None   # Dataset belonging to the Models of the scanned source code
+executor = ThreadPoolExecutor(max_workers=1)    # Worker which runs the tasks of the window (scan, evaluate and generate)
+model_executor = ThreadPoolExecutor(max_workers=1)  # Background worker which loads or trains the model
+predictor_future = None # Predictor being prepared by the background worker since the last scan
+task_cancel = None  # Cancellation flag of the running task (None if there is none)
+button_states = {}  # States of the buttons before running a task
+poll_interval = 100 # Milliseconds between checks of the workers
+
+def run_task(steps, on_done):   # Runs the steps of a task in the worker, showing its progress until it ends
+    global task_cancel
+
+    task_cancel = threading.Event()
+    state = {'step': 0, 'text': steps[0][0]}    # Step being run (written by the worker, read by the window)
+    future = executor.submit(run_steps, steps, task_cancel, state)
+    for button in [scan_button, evaluate_button, generate_button]:
+        button_states[button] = str(button['state'])
+        button.config(state='disabled')
+    cancel_button.config(state='enabled')
+    progress.config(mode='determinate', maximum=len(steps), value=0)
+    root.after(poll_interval, check_task, future, state, len(steps), on_done)
+
+def run_steps(steps, cancel, state):    # Runs each step with the result of the previous one (run by the worker)
+    result = None
+    for i, (text, step) in enumerate(steps):
+        if cancel.is_set():   # The steps already run are not undone.
+            return False, None
+        state['step'] = i
+        state['text'] = text
+        result = step(result)
+    return True, result
+
+def check_task(future, state, total, on_done):  # Shows the progress of the task and handles its result once it ends
+    global task_cancel
+
+    if not future.done():
+        progress.config(value=state['step'])
+        if not task_cancel.is_set():
+            status.config(text=state['text'] + '...')
+        root.after(poll_interval, check_task, future, state, total, on_done)
+        return
+    task_cancel = None
+    for button, button_state in button_states.items():
+        button.config(state=button_state)
+    cancel_button.config(state='disabled')
+    if future.exception() is not None:
+        traceback.print_exception(future.exception())  # The worker thread failed, so its traceback is reported here
+        progress.config(value=0)
+        status.config(text='Error: ' + str(future.exception()))
+        return
+    completed, result = future.result()
+    if not completed:
+        progress.config(value=0)
+        status.config(text='Cancelled')
+        return
+    progress.config(value=total)
+    status.config(text='Done')
+    on_done(result)
+
+def toggle_cancel():  # Cancels the running task once its current step ends
+    if task_cancel is not None:
+        task_cancel.set()
+        status.config(text='Cancelling...')
+
+def prepare_predictor(train_data):  # Loads or trains the model (run by the background worker)
+    init_time = time.time()
+    predictor = load_predictor(train_data)  # Exported by a previous training with the same data
+    if predictor is None:
+        from model import load_model
+        load_model(train_data, incremental=True)  # Only learns the new training samples
+        predictor = load_predictor(train_data)
+    return predictor, time.time() - init_time
+
+def check_predictor(future):    # Shows the state of the background worker until the model is ready
+    if future is not predictor_future:  # A new scan started another one
+        return
+    if not future.done():
+        root.after(poll_interval, check_predictor, future)
+        return
+    if future.exception() is not None:
+        traceback.print_exception(future.exception())
+        model_status.config(text='The model could not be loaded: ' + str(future.exception()))
+    else:
+        model_status.config(text='Model ready (' + f'{future.result()[1]:.2f}' + ' seconds)')
+
+def wait_predictor():   # Returns the predictor prepared by the background worker (run by the worker)
+    return predictor_future.result()[0]
 
 def toggle_scan():  # Initialize the source code scanning process
-    global train_data
-    global test_data
-    global init_data
-    global model_data
+    run_task([('Scanning the source code', lambda _: scan_files(load_source_files())),  # Unchanged files are not scanned
+              ('Loading the training data', lambda _test_data: (_test_data, load_train_data())),
+              ('Splitting the test dataset', lambda result: split_test_data(*result))], show_scan)
 
-    _code = load_source_code()  # Loads the source code
-    _test_data = scan(_code)    # Scan the code and return the test dataset
-    _train_data = load_train_data()
-    _init_data = _test_data[_test_data['Name'] == '__init__'].reset_index(drop=True)
+def split_test_data(_test_data, _train_data):   # Splits the scanned samples into Controllers and Models (run by the worker)
+    _symbols = get_symbol_table(_test_data)  # Resolves the Models used by each Controller once
     _model_data = _test_data[_test_data['Name'] != '__init__'].reset_index(drop=True)
     _model_data = _model_data[_model_data['UsedByView'] == False].reset_index(drop=True)
     _test_data = _test_data[_test_data['Name'] != '__init__'].reset_index(drop=True)
     _test_data = _test_data[_test_data['UsedByView'] == True].reset_index(drop=True)
+    return _train_data, _test_data, _symbols, _model_data
+
+def show_scan(result):  # Enables the settings once the source code has been scanned
+    global train_data
+    global test_data
+    global symbols
+    global model_data
+    global predictor_future
 
+    _train_data, _test_data, _symbols, _model_data = result
     window_title.config(state='enabled')
     window_title.delete(0, END)
     window_title.insert(0, 'Main window')
@@ -48,92 +142,126 @@ def toggle_scan():  # Initialize the source code scanning process
 
     train_data = _train_data
     test_data = _test_data
-    init_data = _init_data
+    symbols = _symbols
     model_data = _model_data
 
+    # The model is loaded or trained in the background while the settings are modified.
+
+    predictor_future = model_executor.submit(prepare_predictor, train_data)
+    model_status.config(text='Preparing the model...')
+    root.after(poll_interval, check_predictor, predictor_future)
+
 def toggle_evaluate():  # Evaluate the model by preprocessing and performing a classification using CV
     global train_data
     global test_data
 
-    x_train, y_train, _ = preprocess_and_split(train_data, test_data)
-    classifier = fit(x_train, y_train)
-    evaulate(classifier, x_train, y_train)
+    _train_data = train_data
+    _test_data = test_data
+    run_task([('Waiting for the model', lambda _: wait_predictor()),  # The stored model must not be written twice at once
+              ('Evaluating the model', lambda _: evaluate_model(_train_data, _test_data))], lambda _: None)
+
+def evaluate_model(_train_data, _test_data):    # Saves the metrics and learning curve of the model (run by the worker)
+    from model import load_model, preprocess_and_split, evaulate, get_weights
+    preprocessor, classifier = load_model(_train_data, incremental=True)  # Only learns the new training samples
+    x_train, y_train, _ = preprocess_and_split(_train_data, _test_data, preprocessor)
+    evaulate(classifier, x_train, y_train, sample_weight=get_weights(_train_data))  # Over the labelled samples
 
 def toggle_generate():  # Generates the GUI and destroys this window
     global train_data
     global test_data
-    global init_data
+    global symbols
     global model_data
 
+    # The settings are read here, since the window must only be used by its own thread.
+
     init_time = time.time()
-    x_train, y_train, x_test = preprocess_and_split(train_data, test_data)
-    classifier = fit(x_train, y_train)
-    y_test = classify(classifier, x_test)
-    main_data = pd.concat([test_data, y_test], axis=1)
-    main_data, model_data = refine(main_data, init_data, model_data, main_controller.get(), show_model_attr.get(), hide_model_attr.get(), int(multiple_views.get()), int(window_threshold.get()))
-    generate(main_data, init_data, model_data, main_controller.get(), window_title.get(), "Copyright...", int(multiple_views.get()))
+    _test_data = test_data
+    _symbols = symbols
+    _model_data = model_data
+    settings = (main_controller.get(), show_model_attr.get(), hide_model_attr.get(), int(multiple_views.get()),
+                int(window_threshold.get()), window_title.get())
+    run_task([('Waiting for the model', lambda _: wait_predictor()),
+              ('Classifying the samples', lambda predictor: pd.concat([_test_data, predictor.classify(_test_data)],
+                                                                      axis=1)),  # The training dataset is not preprocessed again
+              ('Refining the View', lambda main_data: refine(main_data, _symbols, _model_data, *settings[:5])),
+              ('Generating the View', lambda result: generate(result[0], _symbols, result[1], settings[0], settings[5],
+                                                              "Copyright...", settings[3]))],
+             lambda _: finish_generate(init_time))
+
+def finish_generate(init_time): # Destroys this window once the GUI has been generated
     print("Elapsed time: " + str(time.time() - init_time) + " seconds")
     root.destroy()
 
-# Initializes the main generator window
-
-root = Tk()
-root.title('MVCGUIGenerator')
-root.resizable(False, False)
-root.columnconfigure(0, weight=1)
-root.columnconfigure(1, weight=1)
-w = (root.winfo_screenwidth() - root.winfo_reqwidth()) // 2
-h = (root.winfo_screenheight() - root.winfo_reqheight()) // 4
-root.geometry(f'+{w}+{h}')
-icon = PhotoImage(file='media/GUIMVCLogo48px.png')
-root.iconphoto(False, icon)
-bold_font = font.nametofont('TkDefaultFont').copy()
-bold_font.configure(weight='bold')
-title_font = font.nametofont('TkDefaultFont').copy()
-title_font.configure(weight='bold', size=16)
-title_style = ttk.Style()
-title_style.configure('Custom.TLabel', font=title_font, foreground="#3f48cc", size=16)  # Hex color (orange-red)
-logo = PhotoImage(file='media/GUIMVCLogo128px.png')
-large_icon = ttk.Label(root, image=logo)
-large_icon.image = logo
-large_icon.grid(row=0, column=0, padx=4, pady=4, columnspan=2)
-title = ttk.Label(root, text='Model-View-Controller GUI Generator', style='Custom.TLabel')
-title.grid(row=1, column=0, padx=4, pady=4, columnspan=2)
-scan_button = ttk.Button(root, text='Scan', width=12, command=lambda:toggle_scan())
-scan_button.grid(row=2, column=0, padx=4, pady=4, columnspan=2)
-desc_1 = ttk.Label(root, text='Main window title:')
-desc_1.grid(row=3, column=0, padx=4, pady=4, sticky='e')
-window_title = ttk.Entry(root, state='disabled')
-window_title.grid(row=3, column=1, padx=4, pady=4, sticky='we')
-desc_2 = ttk.Label(root, text='Main controller:')
-desc_2.grid(row=4, column=0, padx=4, pady=4, sticky='e')
-main_controller = ttk.Combobox(root, state='disabled')
-main_controller.grid(row=4, column=1, padx=4, pady=4, sticky='we')
-show_model_attr = BooleanVar()
-display_model_attributes = ttk.Checkbutton(root, text='Display Model attributes', variable=show_model_attr, state='disabled')
-display_model_attributes.grid(row=5, column=0, padx=4, pady=4, columnspan=2)
-hide_model_attr = BooleanVar()
-hide_methods = ttk.Checkbutton(root, text='Hide methods which return Model attributes', variable=hide_model_attr, state='disabled')
-hide_methods.grid(row=6, column=0, padx=4, pady=4, columnspan=2)
-desc_3 = ttk.Label(root, text='Min. num. of Controllers to split\nthe View into multiple Views:')
-desc_3.grid(row=7, column=0, padx=4, pady=4, sticky='e')
-view_threshold = IntVar()
-multiple_views = ttk.Spinbox(root, textvariable=view_threshold, from_=2, to=5, state='disabled')
-multiple_views.grid(row=7, column=1, padx=4, pady=4, sticky='we')
-desc_4 = ttk.Label(root, text='Min. num. of arguments/return\nvalues to display methods\nin a separate window:')
-desc_4.grid(row=8, column=0, padx=4, pady=4, sticky='e')
-window_threshold = IntVar()
-separate_window = ttk.Spinbox(root, textvariable=window_threshold, from_=2, to=10, state='disabled')
-separate_window.grid(row=8, column=1, padx=4, pady=4, sticky='we')
-cont = ttk.LabelFrame(root, text='About description:', style='Bold.TLabelframe')
-cont.grid(row=9, column=0, padx=4, pady=4, sticky='we', columnspan=2)
-cont.columnconfigure(0, weight=1)
-about = ttk.Entry(cont, state='disabled')
-about.grid(row=0, column=0, padx=4, pady=4, sticky='we')
-evaluate_button = ttk.Button(root, text='Evaluate', width=12, state='disabled', command=lambda:toggle_evaluate())
-evaluate_button.grid(row=10, column=0, padx=4, pady=4, columnspan=2)
-generate_button = ttk.Button(root, text='Generate', width=12, state='disabled', command=lambda:toggle_generate())
-generate_button.grid(row=11, column=0, padx=4, pady=4, columnspan=2)
-_exit = ttk.Button(root, text='Exit', width=11, command=root.destroy)
-_exit.grid(row=12, column=0, padx=4, pady=4, columnspan=2)
-root.mainloop()
\ No newline at end of file
+if __name__ == '__main__':  # Initializes the main generator window (not when imported by worker processes)
+    root = Tk()
+    root.title('MVCGUIGenerator')
+    root.resizable(False, False)
+    root.columnconfigure(0, weight=1)
+    root.columnconfigure(1, weight=1)
+    w = (root.winfo_screenwidth() - root.winfo_reqwidth()) // 2
+    h = (root.winfo_screenheight() - root.winfo_reqheight()) // 4
+    root.geometry(f'+{w}+{h}')
+    icon = PhotoImage(file='media/GUIMVCLogo48px.png')
+    root.iconphoto(False, icon)
+    bold_font = font.nametofont('TkDefaultFont').copy()
+    bold_font.configure(weight='bold')
+    title_font = font.nametofont('TkDefaultFont').copy()
+    title_font.configure(weight='bold', size=16)
+    title_style = ttk.Style()
+    title_style.configure('Custom.TLabel', font=title_font, foreground="#3f48cc", size=16)  # Hex color (orange-red)
+    logo = PhotoImage(file='media/GUIMVCLogo128px.png')
+    large_icon = ttk.Label(root, image=logo)
+    large_icon.image = logo
+    large_icon.grid(row=0, column=0, padx=4, pady=4, columnspan=2)
+    title = ttk.Label(root, text='Model-View-Controller GUI Generator', style='Custom.TLabel')
+    title.grid(row=1, column=0, padx=4, pady=4, columnspan=2)
+    scan_button = ttk.Button(root, text='Scan', width=12, command=lambda:toggle_scan())
+    scan_button.grid(row=2, column=0, padx=4, pady=4, columnspan=2)
+    desc_1 = ttk.Label(root, text='Main window title:')
+    desc_1.grid(row=3, column=0, padx=4, pady=4, sticky='e')
+    window_title = ttk.Entry(root, state='disabled')
+    window_title.grid(row=3, column=1, padx=4, pady=4, sticky='we')
+    desc_2 = ttk.Label(root, text='Main controller:')
+    desc_2.grid(row=4, column=0, padx=4, pady=4, sticky='e')
+    main_controller = ttk.Combobox(root, state='disabled')
+    main_controller.grid(row=4, column=1, padx=4, pady=4, sticky='we')
+    show_model_attr = BooleanVar()
+    display_model_attributes = ttk.Checkbutton(root, text='Display Model attributes', variable=show_model_attr, state='disabled')
+    display_model_attributes.grid(row=5, column=0, padx=4, pady=4, columnspan=2)
+    hide_model_attr = BooleanVar()
+    hide_methods = ttk.Checkbutton(root, text='Hide methods which return Model attributes', variable=hide_model_attr, state='disabled')
+    hide_methods.grid(row=6, column=0, padx=4, pady=4, columnspan=2)
+    desc_3 = ttk.Label(root, text='Min. num. of Controllers to split\nthe View into multiple Views:')
+    desc_3.grid(row=7, column=0, padx=4, pady=4, sticky='e')
+    view_threshold = IntVar()
+    multiple_views = ttk.Spinbox(root, textvariable=view_threshold, from_=2, to=5, state='disabled')
+    multiple_views.grid(row=7, column=1, padx=4, pady=4, sticky='we')
+    desc_4 = ttk.Label(root, text='Min. num. of arguments/return\nvalues to display methods\nin a separate window:')
+    desc_4.grid(row=8, column=0, padx=4, pady=4, sticky='e')
+    window_threshold = IntVar()
+    separate_window = ttk.Spinbox(root, textvariable=window_threshold, from_=2, to=10, state='disabled')
+    separate_window.grid(row=8, column=1, padx=4, pady=4, sticky='we')
+    cont = ttk.LabelFrame(root, text='About description:', style='Bold.TLabelframe')
+    cont.grid(row=9, column=0, padx=4, pady=4, sticky='we', columnspan=2)
+    cont.columnconfigure(0, weight=1)
+    about = ttk.Entry(cont, state='disabled')
+    about.grid(row=0, column=0, padx=4, pady=4, sticky='we')
+    evaluate_button = ttk.Button(root, text='Evaluate', width=12, state='disabled', command=lambda:toggle_evaluate())
+    evaluate_button.grid(row=10, column=0, padx=4, pady=4, columnspan=2)
+    generate_button = ttk.Button(root, text='Generate', width=12, state='disabled', command=lambda:toggle_generate())
+    generate_button.grid(row=11, column=0, padx=4, pady=4, columnspan=2)
+    progress = ttk.Progressbar(root, mode='determinate', length=200)
+    progress.grid(row=12, column=0, padx=4, pady=4, columnspan=2)
+    status = ttk.Label(root, text='')
+    status.grid(row=13, column=0, padx=4, pady=4, columnspan=2)
+    model_status = ttk.Label(root, text='')
+    model_status.grid(row=14, column=0, padx=4, pady=4, columnspan=2)
+    cancel_button = ttk.Button(root, text='Cancel', width=11, state='disabled', command=lambda:toggle_cancel())
+    cancel_button.grid(row=15, column=0, padx=4, pady=4, columnspan=2)
+    _exit = ttk.Button(root, text='Exit', width=11, command=root.destroy)
+    _exit.grid(row=16, column=0, padx=4, pady=4, columnspan=2)
+    root.mainloop()
+    if task_cancel is not None:
+        task_cancel.set()
+    executor.shutdown(wait=False, cancel_futures=True)
+    model_executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
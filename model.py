@@ -1,13 +1,174 @@
-from matplotlib import pyplot as plt
+from joblib import Parallel, delayed
+from matplotlib.figure import Figure
+from sklearn.base import clone
 from sklearn.linear_model import SGDClassifier
-from sklearn.metrics import make_scorer, accuracy_score, precision_score, recall_score, f1_score
-from sklearn.model_selection import cross_validate, GridSearchCV, learning_curve
-from sklearn.pipeline import Pipeline
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from sklearn.model_selection import GridSearchCV, ParameterGrid, ParameterSampler, StratifiedKFold
 from sklearn.preprocessing import StandardScaler
+from predictor import *
+import contextlib
+import hashlib
+import io
+import json
+import math
+import os
+import pickle
+import re
+import sys
+import threading
+import time
 import pandas as pd
 import numpy as np
 
-def preprocess_and_split(train_data, test_data):
+model_path = os.path.join(os.getcwd(), 'cache', 'model.pkl')    # Classifier trained in a previous run
+data_types = ['int', 'float', 'bool', 'complex', 'str', 'list', 'tuple', 'set', 'dict']   # Always one-hot encoded
+evaluation_folder = os.path.join(os.getcwd(), 'evaluation')  # Metrics and learning curve of the last evaluation
+fit_metrics_path = os.path.join(evaluation_folder, 'fit.json')  # Convergence of the last trainings (see fit)
+fit_history = 100   # Maximum number of trainings kept in the fit metrics file
+epoch_pattern = re.compile(r'-- Epoch (\d+)\n[^\n]*Avg\. loss: ([^,\s]+)')   # Epoch report of the SGD classifier
+progress_pattern = re.compile(r'^\[Parallel\(n_jobs=.*(\n|$)', re.M)  # Progress report of joblib (verbose SGD classifier)
+output_lock = threading.Lock()  # Installs and removes the ThreadOutput proxies of sys.stdout and sys.stderr
+output_captures = 0 # Number of threads whose output is being captured (the proxies are removed when none is left)
+fit_metrics_lock = threading.Lock()   # Serializes the updates of the fit metrics file
+metrics = {
+    'accuracy': accuracy_score,
+    'precision': lambda y_true, y_pred: precision_score(y_true, y_pred, average='macro', zero_division=0),
+    'recall': lambda y_true, y_pred: recall_score(y_true, y_pred, average='macro', zero_division=0),
+    'f1': lambda y_true, y_pred: f1_score(y_true, y_pred, average='macro', zero_division=0)
+}   # Metrics computed by evaulate
+param_grid = {
+    'loss': ['hinge', 'log_loss', 'modified_huber'],
+    'penalty': ['l2', 'l1', 'elasticnet'],
+    'alpha': [1e-4, 1e-3, 1e-2],
+    'learning_rate': ['constant', 'optimal', 'adaptive'],
+    'eta0': [0.001, 0.01, 0.1]  # Only used if learning_rate is not 'optimal'
+}   # Hyperparameters explored by get_best_hyperparameters
+
+class Preprocessor:
+    """
+    Preprocessing of the samples, learnt once from the training dataset (the data types of the One-Hot Encoding and the
+    mean and standard deviation of the scaled columns), so that a test dataset only needs to be transformed. It can be
+    serialized (e.g. with pickle) along with the classifier.
+
+    Attributes:
+
+    - types (list): The data types with a One-Hot Encoding column (any other data type has none).
+    - scaler (sklearn.preprocessing.StandardScaler): Scaler of the FromTo and PossibleValues columns.
+    """
+
+    def __init__(self):
+        self.types = []
+        self.scaler = StandardScaler()
+
+    def fit(self, train_data):
+        """
+        Learns the preprocessing from the training dataset.
+
+        Param:
+
+        - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+
+        Return:
+
+        - preprocessor (Preprocessor): The fitted preprocessor itself.
+        """
+        train_data = train_data[train_data['Name'] != '__init__']  # Exclude samples corresponding to constructors
+        types = set(train_data['Type'].dropna().astype(str)) | set(data_types)
+        types.discard('None')
+        self.types = sorted(types)
+        self.scaler.fit(get_numeric_features(train_data), sample_weight=get_weights(train_data))
+        return self
+
+    def partial_fit(self, train_data, sample_weight=None):
+        """
+        Updates the scaling with new training samples (the data types of the One-Hot Encoding are kept).
+
+        Param:
+
+        - train_data (pandas.core.frame.DataFrame): The new training samples.
+        - sample_weight (numpy.ndarray): The weight of each new sample (the Weight column by default).
+
+        Return:
+
+        - preprocessor (Preprocessor): The updated preprocessor itself.
+        """
+        if sample_weight is None:
+            sample_weight = get_weights(train_data)
+        samples = (train_data['Name'] != '__init__').to_numpy()
+        if samples.any():
+            self.scaler.partial_fit(get_numeric_features(train_data[samples]),
+                                    sample_weight=None if sample_weight is None else sample_weight[samples])
+        return self
+
+    def has_types(self, data):
+        """
+        Checks if every data type of the samples was learnt (or has no One-Hot Encoding column anyway).
+
+        Param:
+
+        - data (pandas.core.frame.DataFrame): Training or test samples.
+
+        Return:
+
+        - found (bool): Indicates whether all the data types are known.
+        """
+        return set(data['Type'].dropna().astype(str)) - {'None'} <= set(self.types)
+
+    def transform(self, data):
+        """
+        Converts the samples into the independent variables used by the classifier.
+
+        Param:
+
+        - data (pandas.core.frame.DataFrame): Training or test samples (constructors must be excluded).
+
+        Return:
+
+        - x (pandas.core.frame.DataFrame): Independent variables.
+        """
+        x = pd.DataFrame(index=data.index)
+        _type = data['Type'].astype(object)
+        for data_type in self.types:    # Applies One-Hot Encoding on the Type column.
+            x['Type_' + data_type] = (_type == data_type).to_numpy()
+        for column in ['IsAnArgument', 'IsAMethod', 'IsAReturnValue']:
+            x[column] = data[column].to_numpy()
+
+        # Adds additional information regarding numeric limits.
+
+        x['HasLowerBound'] = (data['From'].abs() > 1e+290).to_numpy()
+        x['HasUpperBound'] = (data['To'] > 1e+290).to_numpy()
+        features = get_numeric_features(data)
+        x[['FromTo', 'PossibleValues']] = self.scaler.transform(features) if len(features) else features
+        x = x[sorted(x.columns)]
+        return x.reset_index(drop=True)
+
+    def get_feature_names(self):
+        """
+        Returns the names of the independent variables, in the order of the columns of transform_matrix (the same
+        order as the columns of transform).
+
+        Return:
+
+        - feature_names (list): The names of the independent variables.
+        """
+        return get_feature_names(self.types)
+
+    def transform_matrix(self, data):
+        """
+        Converts the samples into the independent variables used by the classifier (see transform), writing them
+        straight into a contiguous float32 matrix with a fixed layout (see predictor.build_feature_matrix).
+
+        Param:
+
+        - data (pandas.core.frame.DataFrame): Training or test samples (constructors must be excluded).
+
+        Return:
+
+        - x (numpy.ndarray): Independent variables (one row per sample).
+        """
+        return build_feature_matrix(data, self.types, self.scaler.mean_, self.scaler.scale_)
+
+def preprocess_and_split(train_data, test_data, preprocessor=None):
     """
     Preprocesses the data and divides it into independent variables (x) and target variables (y).
 
@@ -15,6 +176,7 @@ def preprocess_and_split(train_data, test_data):
 
     - train_data (pandas.core.frame.DataFrame): The whole training dataset.
     - test_data (pandas.core.frame.DataFrame): The whole test dataset.
+    - preprocessor (Preprocessor): The fitted preprocessor (default is a new one fitted with the training dataset).
 
     Return:
 
@@ -22,68 +184,362 @@ def preprocess_and_split(train_data, test_data):
     - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
     - x_test (pandas.core.frame.DataFrame): Independent variables from test dataset.
     """
-    x = pd.concat([train_data.iloc[:, :-1], test_data])
-    x = x.reset_index(drop=True)
-
-    data_types = ['int', 'float', 'bool', 'complex', 'str', 'list', 'tuple', 'set', 'dict']
-    x = x[x['Name'] != '__init__'] # Exclude samples corresponding to constructors
-
-    # Drops columns that will not be taken into account in learning.
-
-    x = x.drop(columns=['Name', 'DefaultValue', 'BelongsTo', 'ClassName', 'UsedByView'])
-    #x = x.drop(columns=['Name', 'DefaultValue', 'PossibleValues', 'BelongsTo', 'ClassName', 'UsedByView'])
-    for i in range(1, 11):
-        x = x.drop(columns=['ArgumentName' + str(i), 'ArgumentType' + str(i), 'ReturnValueName' + str(i), 'ReturnValueType' + str(i)])
-
-    # Converts PossibleValues into numeric data.
-
-    x['PossibleValues'] = x['PossibleValues'].fillna('')
-    x['PossibleValues'] = x['PossibleValues'].str.count(',')
-    one_hot_encoding = pd.get_dummies(x['Type'], prefix='Type') # Applies One-Hot Encoding on the Type column.
-    x = x.drop(columns=['Type'])
-    x = pd.concat([one_hot_encoding, x], axis=1)
-    for data_type in data_types:
-        if 'Type_' + data_type not in x.columns.to_list():
-            x['Type_' + data_type] = False
-
-    # Adds additional information regarding numeric limits.
-
-    x['HasLowerBound'] = abs(x['From']) > 1e+290
-    x['HasUpperBound'] = x['To'] > 1e+290
-    x[['From', 'To']] = x[['From', 'To']].map(
-        lambda z: 0.0 if abs(z) > 1e+290 else z # Converts numeric limits into zeros
-    )
-    x['FromTo'] = x['To'] - x['From']   # Merges From and To columns by substract
-    x = x.drop(columns=['From', 'To'])
-    scaler = StandardScaler()   # Applies StandardScaler() over FromTo column.
-    x['FromTo'] = scaler.fit_transform(x[['FromTo']])
-    x['PossibleValues'] = scaler.fit_transform(x[['PossibleValues']])
-    x = x[sorted(x.columns)]
-    if 'Type_None' in x.columns:
-        x = x.drop('Type_None', axis=1)
-    x_train = x.head(len(train_data))
+    if preprocessor is None:
+        preprocessor = Preprocessor().fit(train_data)
+    x_train = preprocessor.transform(train_data)
     y_train = train_data.iloc[:, -1]
-    x_test = x.tail(len(test_data)).reset_index(drop=True)
+    x_test = preprocessor.transform(test_data)
     return x_train, y_train, x_test
 
-
-def fit(x_train, y_train):
+def fit(x_train, y_train, sample_weight=None, warm_start=None, path=fit_metrics_path):
     """
-    Trains a logistic regression classifier using Stochastic Gradient Descent (SGD).
+    Trains a logistic regression classifier using Stochastic Gradient Descent (SGD). The convergence of the training
+    (the average loss of each epoch, the number of epochs and the time spent) is appended to the fit metrics file.
 
     Param:
 
-    - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
+    - x_train (pandas.core.frame.DataFrame/numpy.ndarray): Independent variables from training dataset.
     - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+    - sample_weight (numpy.ndarray): The weight of each sample (see get_weights). Default value is None (every sample
+      weighs the same).
+    - warm_start (sklearn.linear_model._stochastic_gradient.SGDClassifier): A classifier trained before, whose
+      coefficients and intercepts are the starting point (only if it has the same widgets and independent variables).
+      Default value is None (it starts from zero).
+    - path (str): The path of the fit metrics file.
 
     Return:
 
     - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
     """
-    classifier = SGDClassifier(alpha=0.001, eta0=0.001, learning_rate='optimal', loss='log_loss', penalty='l2', max_iter=1000)
-    classifier.fit(x_train, y_train)
+    classifier = SGDClassifier(**get_hyperparameters())
+    init = {}
+    if warm_start is not None and np.array_equal(warm_start.classes_, np.unique(y_train)) \
+            and warm_start.coef_.shape[1] == x_train.shape[1]:
+        init = {'coef_init': warm_start.coef_, 'intercept_init': warm_start.intercept_}
+
+    # The SGD classifier reports the average loss of each epoch when it is verbose, so its output is captured.
+
+    classifier.set_params(verbose=1)
+    init_time = time.perf_counter()
+    with capture_thread_output() as (output, errors):
+        classifier.fit(x_train, y_train, sample_weight=sample_weight, **init)
+    elapsed = time.perf_counter() - init_time
+    classifier.set_params(verbose=0)
+    if sys.stderr is not None:  # Warnings are kept, progress reports are not (there is no stderr under pythonw).
+        sys.stderr.write(progress_pattern.sub('', errors.getvalue()))
+    save_fit_metrics(classifier, output.getvalue(), elapsed, bool(init), len(y_train), path)
     return classifier
 
+class ThreadOutput:
+    """
+    Proxy of sys.stdout or sys.stderr which sends what some threads write to their own buffers, and everything else
+    to the original stream. Unlike contextlib.redirect_stdout, it does not capture the output of other threads (e.g.
+    the window or the scan running while the model is trained). If there is no original stream (e.g. under pythonw),
+    the output of other threads is discarded.
+
+    Attributes:
+
+    - stream (io.TextIOBase): The original stream (None if there is none).
+    - buffers (dict): The buffer of each thread whose output is captured (by thread identifier).
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+
+    def write(self, text):
+        buffer = self.buffers.get(threading.get_ident())
+        if buffer is None:
+            buffer = self.stream
+        return len(text) if buffer is None else buffer.write(text)
+
+    def flush(self):
+        if threading.get_ident() not in self.buffers and self.stream is not None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+@contextlib.contextmanager
+def capture_thread_output():
+    """
+    Captures what the current thread writes to sys.stdout and sys.stderr (see ThreadOutput). The proxies are installed
+    by the first capture and removed by the last one, so the original streams are restored afterwards.
+
+    Return:
+
+    - output (io.StringIO): What the thread wrote to sys.stdout.
+    - errors (io.StringIO): What the thread wrote to sys.stderr.
+    """
+    global output_captures
+    ident = threading.get_ident()
+    buffers = io.StringIO(), io.StringIO()
+    with output_lock:
+        if not isinstance(sys.stdout, ThreadOutput):
+            sys.stdout = ThreadOutput(sys.stdout)
+        if not isinstance(sys.stderr, ThreadOutput):
+            sys.stderr = ThreadOutput(sys.stderr)
+        proxies = sys.stdout, sys.stderr
+        for proxy, buffer in zip(proxies, buffers):
+            proxy.buffers[ident] = buffer
+        output_captures += 1
+    try:
+        yield buffers
+    finally:
+        with output_lock:
+            for proxy in proxies:
+                del proxy.buffers[ident]
+            output_captures -= 1
+            if not output_captures:
+
+                # The original streams are restored, unless something else has replaced the proxies meanwhile.
+
+                if sys.stdout is proxies[0]:
+                    sys.stdout = proxies[0].stream
+                if sys.stderr is proxies[1]:
+                    sys.stderr = proxies[1].stream
+
+def save_fit_metrics(classifier, output, elapsed, warm_start, samples, path=fit_metrics_path):
+    """
+    Appends the convergence of a training to the fit metrics file (only the last trainings are kept, see fit_history).
+    If the classifier did not converge, it is reported.
+
+    Param:
+
+    - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
+    - output (str): The output of the classifier while training (verbose).
+    - elapsed (float): The time spent training (in seconds).
+    - warm_start (bool): Indicates whether the training started from the coefficients of a previous classifier.
+    - samples (int): The number of training samples.
+    - path (str): The path of the fit metrics file.
+    """
+
+    # The classifier trains one binary classifier per widget (only one if there are two widgets), one after another.
+
+    losses = []
+    for epoch, loss in epoch_pattern.findall(output):
+        if epoch == '1':
+            losses.append([])
+        losses[-1].append(float(loss))
+    names = [str(widget) for widget in classifier.classes_] if len(classifier.classes_) > 2 \
+        else [str(classifier.classes_[-1])]
+    params = classifier.get_params()
+    converged = classifier.n_iter_ < params['max_iter']
+    entry = {'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'samples': samples,
+             'features': int(classifier.coef_.shape[1]), 'warm_start': warm_start,
+             'hyperparameters': {name: params[name] for name in sorted(default_hyperparameters.keys() | {
+                 'tol', 'n_iter_no_change'})},
+             'epochs': int(classifier.n_iter_), 'converged': bool(converged), 'fit_time': elapsed,
+             'loss': dict(zip(names, losses))}
+    with fit_metrics_lock:  # Trainings running in different threads append their entries one after another.
+        history = []
+        if os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    history = json.load(file)
+            except ValueError:  # The file is corrupt, so it is started again.
+                history = []
+        history.append(entry)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(history[-fit_history:], file, indent=4)
+        os.replace(temp_path, path)
+    if not converged:
+        print("The classifier did not converge after " + str(classifier.n_iter_) + " epochs (see " + path + ")")
+
+def get_weights(data):
+    """
+    Returns the weight of each training sample: the number of identical samples it stands for in the compacted
+    training dataset (see load.compact_train_data).
+
+    Param:
+
+    - data (pandas.core.frame.DataFrame): Training samples.
+
+    Return:
+
+    - weights (numpy.ndarray): The weight of each sample (None if the samples have no Weight column).
+    """
+    if 'Weight' not in data.columns:
+        return None
+    return data['Weight'].to_numpy(dtype=np.float64)
+
+def load_model(train_data, path=model_path, incremental=False):
+    """
+    Returns the preprocessor and classifier trained in a previous run if they were trained with the same data and
+    hyperparameters (see get_fingerprint). Otherwise, it trains new ones (see Preprocessor and fit) and stores them
+    for later runs. In incremental mode, if the training dataset only has new samples (e.g. new labelled rows have
+    been added to the /data files), the stored ones are updated with them instead (see update_model).
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+    - path (str): The path of the stored model.
+    - incremental (bool): Indicates whether the stored model is updated with the new samples instead of retrained.
+      Default value is False.
+
+    Return:
+
+    - preprocessor (Preprocessor): Fitted preprocessor.
+    - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
+    """
+    init_time = time.perf_counter()
+    hyperparameters = get_hyperparameters()
+    row_hashes = get_row_hashes(train_data, weighted=False)
+    fingerprint = get_fingerprint(get_row_hashes(train_data), hyperparameters)
+    stored = read_model(path)
+    if stored is not None and stored['fingerprint'] == fingerprint:
+        export_predictor(stored['preprocessor'], stored['classifier'], fingerprint)
+        print("Stored model loaded (" + f"{time.perf_counter() - init_time:.3f}" + " seconds)")
+        return stored['preprocessor'], stored['classifier']
+    if incremental and stored is not None and stored['hyperparameters'] == hyperparameters:
+        updated = update_model(stored, train_data, row_hashes)
+        if updated is not None:
+            stored['fingerprint'] = fingerprint
+            write_model(stored, path)
+            export_predictor(stored['preprocessor'], stored['classifier'], fingerprint)
+            print(str(updated) + " new samples learnt (" + f"{time.perf_counter() - init_time:.3f}" + " seconds)")
+            return stored['preprocessor'], stored['classifier']
+    preprocessor = Preprocessor().fit(train_data)
+
+    # The stored classifier is the starting point of the new one, as long as it has the same independent variables.
+
+    warm_start = None
+    if stored is not None and stored['preprocessor'].get_feature_names() == preprocessor.get_feature_names():
+        warm_start = stored['classifier']
+    classifier = fit(preprocessor.transform_matrix(train_data), train_data.iloc[:, -1], get_weights(train_data),
+                     warm_start)
+
+    # The preprocessor and the classifier are saved together (with the samples learnt), replacing the previous ones.
+
+    learned, _, learned_weights = get_learned_samples(train_data, row_hashes)
+    write_model({'fingerprint': fingerprint, 'hyperparameters': hyperparameters, 'learned': learned,
+                 'learned_weights': learned_weights, 'preprocessor': preprocessor, 'classifier': classifier}, path)
+    export_predictor(preprocessor, classifier, fingerprint)
+    print("Model trained (" + f"{time.perf_counter() - init_time:.3f}" + " seconds)")
+    return preprocessor, classifier
+
+def update_model(stored, train_data, row_hashes):
+    """
+    Updates a stored model with the training samples it has not learnt yet, using partial_fit (a single epoch over the
+    new samples). A sample learnt before whose weight has grown (new identical samples have been merged into it, see
+    load.compact_train_data) is learnt again, weighted by the increase only. It is not possible when samples learnt
+    before have been removed, or when the new samples have data types or widgets unknown by the stored model (it must
+    be retrained then).
+
+    Param:
+
+    - stored (dict): The stored model (fingerprint, hyperparameters, samples learnt and their weights, preprocessor and
+      classifier).
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+    - row_hashes (numpy.ndarray): The hash of each training sample, without its weight (see get_row_hashes).
+
+    Return:
+
+    - updated (int): The number of new samples learnt (None if the model could not be updated).
+    """
+    hashes, first, weights = get_learned_samples(train_data, row_hashes)
+    positions = np.searchsorted(hashes, stored['learned'])
+    if (positions == len(hashes)).any() or (hashes[positions] != stored['learned']).any():
+        return None     # Samples learnt before have been removed.
+    increase = weights.copy()
+    increase[positions] -= stored['learned_weights']
+    if (increase < 0).any():    # Samples learnt before have been removed.
+        return None
+    new_samples = increase > 0
+    new_data = train_data.iloc[first[new_samples]]
+    new_weights = increase[new_samples]
+    preprocessor = stored['preprocessor']
+    classifier = stored['classifier']
+    if not preprocessor.has_types(new_data) or not set(new_data.iloc[:, -1]) <= set(classifier.classes_):
+        return None
+    if len(new_data):
+        preprocessor.partial_fit(new_data, new_weights)
+        classifier.partial_fit(preprocessor.transform_matrix(new_data), new_data.iloc[:, -1], sample_weight=new_weights)
+    stored['learned'] = hashes
+    stored['learned_weights'] = weights
+    return int(round(new_weights.sum()))
+
+def get_learned_samples(train_data, row_hashes):
+    """
+    Groups the training samples by hash, adding up their weights.
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+    - row_hashes (numpy.ndarray): The hash of each training sample, without its weight (see get_row_hashes).
+
+    Return:
+
+    - hashes (numpy.ndarray): The different hashes (sorted).
+    - first (numpy.ndarray): The position of the first training sample with each hash.
+    - weights (numpy.ndarray): The total weight of the training samples with each hash.
+    """
+    hashes, first, inverse = np.unique(row_hashes, return_index=True, return_inverse=True)
+    weights = np.bincount(inverse, weights=get_weights(train_data), minlength=len(hashes)).astype(np.float64)
+    return hashes, first, weights
+
+def read_model(path):
+    """
+    Reads a stored model.
+
+    Param:
+
+    - path (str): The path of the stored model.
+
+    Return:
+
+    - stored (dict): The stored model (None if it is missing or unreadable).
+    """
+    try:
+        with open(path, "rb") as file:
+            stored = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(stored, dict) or not {'fingerprint', 'hyperparameters', 'learned', 'learned_weights',
+                                            'preprocessor', 'classifier'} <= stored.keys():  # Stored by an older version.
+        return None
+    return stored
+
+def write_model(stored, path):
+    """
+    Stores a model, replacing the previous one.
+
+    Param:
+
+    - stored (dict): The model (fingerprint, hyperparameters, samples learnt and their weights, preprocessor and
+      classifier).
+    - path (str): The path of the stored model.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, "wb") as file:
+        pickle.dump(stored, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+def export_predictor(preprocessor, classifier, fingerprint, path=predictor_path):
+    """
+    Exports the trained model (the coefficients and intercepts of the linear classifier, the widgets and the
+    preprocessing) to a .npz file, so that the test dataset can be classified without scikit-learn (see
+    predictor.Predictor).
+
+    Param:
+
+    - preprocessor (Preprocessor): Fitted preprocessor.
+    - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
+    - fingerprint (str): The fingerprint of the training process (see predictor.get_fingerprint).
+    - path (str): The path of the exported model.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, "wb") as file:
+        np.savez(file, coef=classifier.coef_.astype(np.float64), intercept=classifier.intercept_.astype(np.float64),
+                 classes=np.array([str(widget) for widget in classifier.classes_]),
+                 feature_names=np.array(preprocessor.get_feature_names()), types=np.array(preprocessor.types, dtype=str),
+                 mean=preprocessor.scaler.mean_, scale=preprocessor.scaler.scale_, fingerprint=np.array(fingerprint))
+    os.replace(temp_path, path)
+
 def classify(classifier, x_test):
     """
     Classify using the independent variables of the test data.
@@ -91,7 +547,7 @@ def classify(classifier, x_test):
     Param:
 
     - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
-    - x_test (pandas.core.frame.DataFrame): Independent variables from test dataset.
+    - x_test (pandas.core.frame.DataFrame/numpy.ndarray): Independent variables from test dataset.
 
     Return:
 
@@ -100,62 +556,292 @@ def classify(classifier, x_test):
     y_test = classifier.predict(x_test)
     return pd.DataFrame(y_test, columns=['Widget'])
 
-def evaulate(classifier, x_train, y_train):
+def evaulate(classifier, x_train, y_train, folder=evaluation_folder, n_jobs=-1, sample_weight=None):
+    """
+    Evaluates the trained model using CV, saving the metrics (metrics.json) and the learning curve
+    (learning_curve.png) in a folder instead of displaying them. If the same model was already evaluated with the same
+    training data, the saved results are reused.
+
+    Param:
+
+    - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
+    - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
+    - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+    - folder (str): The folder where the results are saved.
+    - n_jobs (int): The number of processes used to evaluate the folds (default is the number of CPUs).
+    - sample_weight (numpy.ndarray): The weight of each sample (see get_weights). Each sample is evaluated as many times
+      as its weight (see expand_samples). Default value is None (every sample once).
+
+    Return:
+
+    - results (dict): The mean and standard deviation of each metric, and the learning curve.
     """
-    Evaluates the trained model visualizing the metrics and the learning curve.
+    x_train, y_train = expand_samples(x_train, y_train, sample_weight)
+    metrics_path = os.path.join(folder, 'metrics.json')
+    plot_path = os.path.join(folder, 'learning_curve.png')
+    fingerprint = get_evaluation_fingerprint(classifier, x_train, y_train)
+    results = None
+    if os.path.isfile(plot_path):
+        try:
+            with open(metrics_path, "r", encoding="utf-8") as file:
+                results = json.load(file)
+        except (OSError, ValueError):
+            pass
+    if results is None or results.get('fingerprint') != fingerprint:
+        results = cross_validate_with_learning_curve(classifier, x_train, y_train, n_jobs)
+        results['fingerprint'] = fingerprint
+        os.makedirs(folder, exist_ok=True)
+        save_learning_curve(results, plot_path)
+        with open(metrics_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+    for metric in metrics:
+        print(f"{metric[0].upper()}{metric[1:]}: Mean = {results[metric]['mean']:.3f}, Std = {results[metric]['std']:.3f}")
+    print("Results saved in " + folder)
+    return results
+
+def cross_validate_with_learning_curve(classifier, x_train, y_train, n_jobs=-1):
+    """
+    Applies CV (4 folds) and computes the learning curve (10 training set sizes) over the same folds, which are
+    evaluated in parallel. The model trained with the whole training set of each fold gives both the metrics and the
+    last point of the learning curve, so it is trained only once.
 
     Param:
 
     - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
     - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
     - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+    - n_jobs (int): The number of processes used to evaluate the folds (default is the number of CPUs).
+
+    Return:
+
+    - results (dict): The mean and standard deviation of each metric, and the learning curve.
     """
-    metrics = {
-        'accuracy': make_scorer(accuracy_score),
-        'precision': make_scorer(precision_score, average='macro'),
-        'recall': make_scorer(recall_score, average='macro'),
-        'f1': make_scorer(f1_score, average='macro')
-    }
-    results = cross_validate(classifier, x_train, y_train, scoring=metrics, cv=4)   # Applies CV
+    x = x_train.to_numpy(dtype=np.float64)
+    y = np.asarray(y_train)
+    folds = list(StratifiedKFold(n_splits=4).split(x, y))
+    max_size = min(len(train) for train, _ in folds)
+    train_sizes = np.unique(np.clip((np.linspace(0.1, 1.0, 10) * max_size).astype(int), 1, max_size))
+    fold_results = Parallel(n_jobs=n_jobs)(delayed(evaluate_fold)(classifier, x, y, train, test, train_sizes)
+                                           for train, test in folds)
+    results = {}
     for metric in metrics:
-        scores = results['test_' + metric]
-        print(f'{metric[0].upper()}{metric[1:]}: Mean = {scores.mean():.3f}, Std = {scores.std():.3f}')
+        scores = np.array([fold_result[metric] for fold_result in fold_results])
+        results[metric] = {'mean': float(scores.mean()), 'std': float(scores.std())}
+    results['learning_curve'] = {
+        'train_sizes': train_sizes.tolist(),
+        'train_scores': np.nanmean([fold_result['train_scores'] for fold_result in fold_results], axis=0).tolist(),
+        'test_scores': np.nanmean([fold_result['test_scores'] for fold_result in fold_results], axis=0).tolist()
+    }
+    return results
+
+def evaluate_fold(classifier, x, y, train, test, train_sizes):
+    """
+    Trains the model with increasing parts of the training set of a fold, computing the accuracy of each one, and the
+    metrics of the model trained with the whole training set.
+
+    Param:
+
+    - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Model to clone.
+    - x (numpy.ndarray): Independent variables from training dataset.
+    - y (numpy.ndarray): Target variables from training dataset.
+    - train (numpy.ndarray): Indexes of the training set of the fold.
+    - test (numpy.ndarray): Indexes of the validation set of the fold.
+    - train_sizes (numpy.ndarray): The sizes of the parts of the training set (the last one stands for the whole set).
+
+    Return:
+
+    - fold_result (dict): The metrics, and the training and validation accuracy of each size.
+    """
+    fold_result = {'train_scores': [], 'test_scores': []}
+    predictions = None
+    for size in train_sizes:
+        part = train[:size] if size < train_sizes[-1] else train
+        try:
+            model = clone(classifier).fit(x[part], y[part])
+        except ValueError:  # A part with a single widget cannot be learnt.
+            fold_result['train_scores'].append(np.nan)
+            fold_result['test_scores'].append(np.nan)
+            continue
+        predictions = model.predict(x[test])
+        fold_result['train_scores'].append(accuracy_score(y[part], model.predict(x[part])))
+        fold_result['test_scores'].append(accuracy_score(y[test], predictions))
+    for metric, function in metrics.items():    # Metrics of the model trained with the whole training set.
+        fold_result[metric] = function(y[test], predictions)
+    return fold_result
+
+def save_learning_curve(results, path):
+    """
+    Saves the plot of the learning curve as an image (without any window, so it does not block the main window).
 
-    # Displays the learning curve of the model
+    Param:
 
-    train_sizes, train_scores, test_scores = learning_curve(classifier, x_train, y_train, cv=4, scoring='accuracy',
-                                                            n_jobs=-1, train_sizes=np.linspace(0.1, 1.0, 10))
-    train_scores_mean = np.mean(train_scores, axis=1)
-    test_scores_mean = np.mean(test_scores, axis=1)
-    plt.figure(figsize=(6, 4))
-    plt.plot(train_sizes, train_scores_mean, 'o-', label='Training', color='#bbbbbb')
-    plt.plot(train_sizes, test_scores_mean, 'o-', label='Validation', color='#3f48cc')
-    plt.xlabel('Training set size')
-    plt.ylabel('Accuracy')
-    plt.title('Learning curve')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+    - results (dict): The results of the evaluation (see cross_validate_with_learning_curve).
+    - path (str): The path of the image.
+    """
+    curve = results['learning_curve']
+    figure = Figure(figsize=(6, 4))
+    axes = figure.subplots()
+    axes.plot(curve['train_sizes'], curve['train_scores'], 'o-', label='Training', color='#bbbbbb')
+    axes.plot(curve['train_sizes'], curve['test_scores'], 'o-', label='Validation', color='#3f48cc')
+    axes.set_xlabel('Training set size')
+    axes.set_ylabel('Accuracy')
+    axes.set_title('Learning curve')
+    axes.legend()
+    axes.grid(True)
+    figure.savefig(path, bbox_inches='tight')
 
-def get_best_hyperparameters(x_train, y_train):
+def expand_samples(x_train, y_train, sample_weight):
     """
-    Get the best hyperparameters of the model using a Grid Search.
+    Repeats each training sample as many times as its weight, so that the samples merged by load.compact_train_data
+    are evaluated as the labelled samples they stand for.
 
     Param:
 
     - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
     - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+    - sample_weight (numpy.ndarray): The weight of each sample (None if every sample stands for itself only).
+
+    Return:
+
+    - x_expanded (pandas.core.frame.DataFrame): Independent variables of the labelled samples.
+    - y_expanded (pandas.core.frame.DataFrame): Target variables of the labelled samples.
     """
-    pipeline = Pipeline([
-        ('sgd', SGDClassifier(random_state=42))  # Clasificador
-    ])
-    param_grid = {
-        'sgd__loss': ['hinge', 'log_loss', 'modified_huber'],
-        'sgd__penalty': ['l2', 'l1', 'elasticnet'],
-        'sgd__alpha': [1e-4, 1e-3, 1e-2],
-        'sgd__learning_rate': ['constant', 'optimal', 'adaptive'],
-        'sgd__eta0': [0.001, 0.01, 0.1],  # solo si learning_rate='constant'
-    }
-    grid_search = GridSearchCV(pipeline, param_grid, cv=3, scoring='accuracy', n_jobs=-1)
-    grid_search.fit(x_train, y_train)
-    print(grid_search.best_params_)
\ No newline at end of file
+    if sample_weight is None:
+        return x_train, y_train
+    positions = np.repeat(np.arange(len(x_train)), np.rint(sample_weight).astype(int))
+    return x_train.iloc[positions].reset_index(drop=True), y_train.iloc[positions].reset_index(drop=True)
+
+def get_evaluation_fingerprint(classifier, x_train, y_train):
+    """
+    Computes the fingerprint of an evaluation: the hash of the training data and the hyperparameters of the model.
+
+    Param:
+
+    - classifier (sklearn.linear_model._stochastic_gradient.SGDClassifier): Trained model.
+    - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
+    - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+
+    Return:
+
+    - fingerprint (str): The SHA-256 hash (hexadecimal).
+    """
+    sha256 = hashlib.sha256()
+    sha256.update(json.dumps([list(x_train.columns), classifier.get_params()], sort_keys=True, default=str).encode('utf-8'))
+    sha256.update(pd.util.hash_pandas_object(x_train, index=False).to_numpy().tobytes())
+    sha256.update(pd.util.hash_pandas_object(y_train.astype(str), index=False).to_numpy().tobytes())
+    return sha256.hexdigest()
+
+def get_best_hyperparameters(x_train, y_train, search='halving', max_candidates=81, time_budget=60.0, factor=3,
+                             path=hyperparameters_path, sample_weight=None):
+    """
+    Get the best hyperparameters of the model (among those in param_grid) and saves them, so that fit uses them from
+    then on. The search can be exhaustive (Grid Search over every combination) or budgeted (Successive Halving over a
+    random sample of combinations: all of them are evaluated with a small part of the training data, and only the best
+    ones are evaluated again with a larger part, until a single one remains or the time budget runs out).
+
+    Param:
+
+    - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
+    - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+    - search (str): 'halving' (budgeted search) or 'grid' (exhaustive search). Default value is 'halving'.
+    - max_candidates (int): The maximum number of combinations evaluated by the budgeted search. Default value is 81.
+    - time_budget (float): The time (in seconds) after which the budgeted search stops at the end of the current round.
+      Default value is 60.0.
+    - factor (int): The proportion of combinations discarded in each round of the budgeted search (and how much the
+      part of the training data grows). Default value is 3.
+    - path (str): The path where the hyperparameters are saved.
+    - sample_weight (numpy.ndarray): The weight of each sample (see get_weights). Each sample is evaluated as many times
+      as its weight (see expand_samples). Default value is None (every sample once).
+
+    Return:
+
+    - best_params (dict): The best hyperparameters.
+    """
+    init_time = time.perf_counter()
+    x_train, y_train = expand_samples(x_train, y_train, sample_weight)
+    if search == 'grid':
+        grid_search = GridSearchCV(SGDClassifier(random_state=42), param_grid, cv=3, scoring='accuracy', n_jobs=-1)
+        grid_search.fit(x_train, y_train)
+        best_params = grid_search.best_params_
+    else:
+        best_params = successive_halving(x_train, y_train, max_candidates, time_budget, factor)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(best_params, file, indent=4)
+    print(str(best_params) + " (" + f"{time.perf_counter() - init_time:.3f}" + " seconds)")
+    return best_params
+
+def successive_halving(x_train, y_train, max_candidates=81, time_budget=60.0, factor=3):
+    """
+    Searches the best hyperparameters using Successive Halving with 3-fold CV (see get_best_hyperparameters).
+
+    Param:
+
+    - x_train (pandas.core.frame.DataFrame): Independent variables from training dataset.
+    - y_train (pandas.core.frame.DataFrame): Target variables from training dataset.
+    - max_candidates (int): The maximum number of combinations evaluated. Default value is 81.
+    - time_budget (float): The time (in seconds) after which the search stops at the end of the current round.
+      Default value is 60.0.
+    - factor (int): The proportion of combinations discarded in each round. Default value is 3.
+
+    Return:
+
+    - best_params (dict): The best hyperparameters.
+    """
+    init_time = time.perf_counter()
+    x = x_train.to_numpy(dtype=np.float64)
+    y = np.asarray(y_train)
+    random_state = np.random.RandomState(42)
+    candidates = list(ParameterSampler(param_grid, n_iter=min(max_candidates, len(ParameterGrid(param_grid))),
+                                       random_state=random_state))
+
+    # The training set of each fold is shuffled once, so that every part used in a round is a random sample.
+
+    folds = [(random_state.permutation(train), test) for train, test in StratifiedKFold(n_splits=3).split(x, y)]
+
+    # Each halving round divides the part of the training data by factor, as long as the smallest part has at least
+    # two samples per widget.
+
+    rounds = math.ceil(math.log(len(candidates), factor)) if len(candidates) > 1 else 0
+    min_samples = 2 * len(np.unique(y))
+    max_train = min(len(train) for train, _ in folds)
+    rounds = min(rounds, int(math.log(max_train / min_samples, factor))) if max_train > min_samples else 0
+    best_params = candidates[0]
+    for _round in range(rounds + 1):
+        ratio = factor ** (_round - rounds)  # Part of the training data used in this round (all of it in the last one).
+        scores = Parallel(n_jobs=-1)(delayed(score_candidate)(params, x, y, folds, ratio) for params in candidates)
+        order = np.argsort(scores, kind='stable')[::-1]
+        best_params = candidates[order[0]]
+        print(f"Round {_round + 1}: {len(candidates)} candidates, {ratio:.0%} of the data, best accuracy = "
+              f"{scores[order[0]]:.3f}")
+        if time.perf_counter() - init_time > time_budget:   # The time budget has run out.
+            break
+        if _round < rounds:
+            candidates = [candidates[i] for i in order[:max(1, len(candidates) // factor)]]
+    return best_params
+
+def score_candidate(params, x, y, folds, ratio):
+    """
+    Computes the mean validation accuracy of a combination of hyperparameters, training with a part of each fold.
+
+    Param:
+
+    - params (dict): The hyperparameters.
+    - x (numpy.ndarray): Independent variables from training dataset.
+    - y (numpy.ndarray): Target variables from training dataset.
+    - folds (list): The (training indexes, validation indexes) of each fold.
+    - ratio (float): The part of the training set of each fold used.
+
+    Return:
+
+    - score (float): The mean accuracy (-1.0 if the parts cannot be learnt).
+    """
+    scores = []
+    for train, test in folds:
+        part = train[:max(1, int(len(train) * ratio))]
+        try:
+            classifier = SGDClassifier(random_state=42, **params).fit(x[part], y[part])
+        except ValueError:  # A part with a single widget cannot be learnt.
+            return -1.0
+        scores.append(accuracy_score(y[test], classifier.predict(x[test])))
+    return float(np.mean(scores))
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+predictor_path = os.path.join(os.getcwd(), 'cache', 'predictor.npz')  # Model exported by model.load_model
+hyperparameters_path = os.path.join(os.getcwd(), 'cache', 'hyperparameters.json')  # Found by get_best_hyperparameters
+feature_columns = ['Name', 'Type', 'From', 'To', 'IsAnArgument', 'IsAMethod', 'IsAReturnValue', 'PossibleValues']
+default_hyperparameters = {'alpha': 0.001, 'eta0': 0.001, 'learning_rate': 'optimal', 'loss': 'log_loss',
+                           'penalty': 'l2', 'max_iter': 1000}   # Hyperparameters of the SGD classifier (if not searched)
+widget_rules = [
+    ('IsAMethod', None, 'Button'),
+    ('IsAnArgument', ['bool'], 'Checkbutton'),
+    ('IsAnArgument', ['list', 'tuple', 'set', 'dict'], 'Treeview'),
+    ('IsAReturnValue', ['list', 'tuple', 'set', 'dict'], 'Treeview')
+]   # Samples with a single possible widget (kind of sample, data types or None for any type, widget)
+
+class Predictor:
+    """
+    Trained widget classifier, loaded from the file exported by model.load_model (see model.export_predictor). It
+    only needs NumPy to classify, since it applies the preprocessing and the linear model (a dot product with the
+    coefficients of each widget) by itself.
+
+    Attributes:
+
+    - coef (numpy.ndarray): The coefficients of each widget (one row per widget, or a single row if there are two).
+    - intercept (numpy.ndarray): The intercept of each widget.
+    - classes (numpy.ndarray): The widgets.
+    - feature_names (list): The names of the independent variables, in order.
+    - types (list): The data types with a One-Hot Encoding column.
+    - mean (numpy.ndarray): The mean of the scaled columns in the training dataset.
+    - scale (numpy.ndarray): The standard deviation of the scaled columns in the training dataset.
+    - fingerprint (str): The fingerprint of the training process (see get_fingerprint).
+    """
+
+    def __init__(self, path=predictor_path):
+        with np.load(path, allow_pickle=False) as file:
+            self.coef = file['coef']
+            self.intercept = file['intercept']
+            self.classes = file['classes']
+            self.feature_names = file['feature_names'].tolist()
+            self.types = file['types'].tolist()
+            self.mean = file['mean']
+            self.scale = file['scale']
+            self.fingerprint = str(file['fingerprint'])
+
+    def predict(self, x):
+        """
+        Predicts the widget of each sample.
+
+        Param:
+
+        - x (numpy.ndarray): Independent variables (see build_feature_matrix).
+
+        Return:
+
+        - y (numpy.ndarray): The widget of each sample.
+        """
+        scores = x.astype(np.float64) @ self.coef.T + self.intercept
+        if self.coef.shape[0] == 1:  # With two widgets, the sign of the single score chooses one of them.
+            return self.classes[(scores[:, 0] > 0).astype(np.intp)]
+        return self.classes[scores.argmax(axis=1)]
+
+    def classify(self, test_data):
+        """
+        Classify the samples of the test dataset.
+
+        Param:
+
+        - test_data (pandas.core.frame.DataFrame): The test dataset (constructors must be excluded).
+
+        Return:
+
+        - result (pandas.core.frame.DataFrame): Target variables from test dataset.
+        """
+        y_test = apply_rules(test_data)
+        ambiguous = pd.isna(y_test)
+        if ambiguous.any():
+            y_test[ambiguous] = self.predict(build_feature_matrix(test_data[ambiguous], self.types, self.mean,
+                                                                  self.scale))
+        print(str(len(y_test) - ambiguous.sum()) + " samples labelled by rules, " + str(ambiguous.sum())
+              + " samples classified")
+        return pd.DataFrame(y_test, columns=['Widget'])
+
+def apply_rules(test_data):
+    """
+    Labels the samples whose widget does not depend on the classifier (see widget_rules), such as methods (always a
+    Button) or boolean arguments (always a Checkbutton).
+
+    Param:
+
+    - test_data (pandas.core.frame.DataFrame): The test dataset (constructors must be excluded).
+
+    Return:
+
+    - y_test (numpy.ndarray): The widget of each sample (None for the ambiguous ones, left to the classifier).
+    """
+    y_test = np.full(len(test_data), None, dtype=object)
+    types = test_data['Type'].astype(object)
+    for kind, data_types, widget in widget_rules:
+        matches = test_data[kind].to_numpy(dtype=bool) & pd.isna(y_test)
+        if data_types is not None:
+            matches &= types.isin(data_types).to_numpy()
+        y_test[matches] = widget
+    return y_test
+
+def load_predictor(train_data, path=predictor_path):
+    """
+    Loads the exported model, as long as it was trained with the same data and hyperparameters.
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+    - path (str): The path of the exported model.
+
+    Return:
+
+    - predictor (Predictor): The exported model (None if it is missing, unreadable or out of date).
+    """
+    try:
+        predictor = Predictor(path)
+    except (OSError, KeyError, ValueError):
+        return None
+    if predictor.fingerprint != get_fingerprint(get_row_hashes(train_data), get_hyperparameters()):
+        return None
+    return predictor
+
+def build_feature_matrix(data, types, mean, scale):
+    """
+    Converts the samples into the independent variables used by the classifier, writing them straight into a
+    contiguous float32 matrix with a fixed layout (see get_feature_names).
+
+    Param:
+
+    - data (pandas.core.frame.DataFrame): Training or test samples (constructors must be excluded).
+    - types (list): The data types with a One-Hot Encoding column.
+    - mean (numpy.ndarray): The mean of the FromTo and PossibleValues columns in the training dataset.
+    - scale (numpy.ndarray): The standard deviation of the FromTo and PossibleValues columns in the training dataset.
+
+    Return:
+
+    - x (numpy.ndarray): Independent variables (one row per sample).
+    """
+    feature_names = get_feature_names(types)
+    column = {name: i for i, name in enumerate(feature_names)}
+    x = np.zeros((len(data), len(feature_names)), dtype=np.float32)
+
+    # The One-Hot Encoding sets a single cell per row, found through the code of its data type (-1 if unknown).
+
+    codes = pd.Index(types).get_indexer(data['Type'].astype(object))
+    rows = np.flatnonzero(codes >= 0)
+    type_columns = np.array([column['Type_' + data_type] for data_type in types], dtype=np.intp)
+    x[rows, type_columns[codes[rows]]] = 1.0
+    for name in ['IsAnArgument', 'IsAMethod', 'IsAReturnValue']:
+        x[:, column[name]] = data[name].to_numpy(dtype=np.float32)
+    x[:, column['HasLowerBound']] = np.abs(data['From'].to_numpy(dtype=np.float64)) > 1e+290
+    x[:, column['HasUpperBound']] = data['To'].to_numpy(dtype=np.float64) > 1e+290
+    features = (get_numeric_features(data) - mean) / scale
+    x[:, column['FromTo']] = features[:, 0]
+    x[:, column['PossibleValues']] = features[:, 1]
+    return x
+
+def get_feature_names(types):
+    """
+    Returns the names of the independent variables, in the order of the columns of the feature matrix.
+
+    Param:
+
+    - types (list): The data types with a One-Hot Encoding column.
+
+    Return:
+
+    - feature_names (list): The names of the independent variables.
+    """
+    return sorted(['Type_' + data_type for data_type in types] + ['IsAnArgument', 'IsAMethod', 'IsAReturnValue',
+                                                                 'HasLowerBound', 'HasUpperBound', 'FromTo',
+                                                                 'PossibleValues'])
+
+def get_numeric_features(data):
+    """
+    Returns the numeric features to be scaled: FromTo (the difference between To and From, where numeric limits are
+    converted into zeros) and PossibleValues (the number of commas separating the possible values).
+
+    Param:
+
+    - data (pandas.core.frame.DataFrame): Training or test samples.
+
+    Return:
+
+    - features (numpy.ndarray): The FromTo and PossibleValues columns.
+    """
+    _from = data['From'].to_numpy(dtype=np.float64)
+    to = data['To'].to_numpy(dtype=np.float64)
+    _from = np.where(np.abs(_from) > 1e+290, 0.0, _from)  # Converts numeric limits into zeros
+    to = np.where(np.abs(to) > 1e+290, 0.0, to)
+    possible_values = np.fromiter((value.count(',') if isinstance(value, str) else 0
+                                   for value in data['PossibleValues'].to_numpy(dtype=object)),
+                                  dtype=np.float64, count=len(data))
+    return np.column_stack([to - _from, possible_values])
+
+def get_feature_hashes(train_data):
+    """
+    Computes the hash of the independent variables (before scaling) and the target variable of each training sample,
+    so that samples the classifier cannot tell apart have the same hash (e.g. the name is not hashed).
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): Training samples (constructors must be excluded).
+
+    Return:
+
+    - feature_hashes (numpy.ndarray): The hash of each sample (uint64).
+    """
+    numeric_features = get_numeric_features(train_data)
+    data = pd.DataFrame({
+        'Type': train_data['Type'].astype(object).fillna('').astype(str).to_numpy(),
+        'IsAnArgument': train_data['IsAnArgument'].to_numpy(dtype=bool),
+        'IsAMethod': train_data['IsAMethod'].to_numpy(dtype=bool),
+        'IsAReturnValue': train_data['IsAReturnValue'].to_numpy(dtype=bool),
+        'HasLowerBound': np.abs(train_data['From'].to_numpy(dtype=np.float64)) > 1e+290,
+        'HasUpperBound': train_data['To'].to_numpy(dtype=np.float64) > 1e+290,
+        'FromTo': numeric_features[:, 0],
+        'PossibleValues': numeric_features[:, 1],
+        'Widget': train_data.iloc[:, -1].astype(object).fillna('').astype(str).to_numpy()
+    })
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+def get_row_hashes(train_data, weighted=True):
+    """
+    Computes the hash of each training sample (the columns used by the preprocessing, the weight and the target
+    variable).
+
+    Param:
+
+    - train_data (pandas.core.frame.DataFrame): The whole training dataset.
+    - weighted (bool): Indicates whether the weight is hashed. Default value is True (without it, a sample keeps its
+      hash when more identical samples are merged into it, see model.update_model).
+
+    Return:
+
+    - row_hashes (numpy.ndarray): The hash of each sample (uint64).
+    """
+    columns = feature_columns + (['Weight'] if weighted and 'Weight' in train_data.columns else [])
+    data = train_data[columns + [train_data.columns[-1]]].astype(object).fillna('').astype(str)
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+def get_fingerprint(row_hashes, hyperparameters):
+    """
+    Computes the fingerprint of a training process: the hash of the training data and the hyperparameters of the
+    classifier.
+
+    Param:
+
+    - row_hashes (numpy.ndarray): The hash of each training sample (see get_row_hashes).
+    - hyperparameters (dict): The hyperparameters of the classifier.
+
+    Return:
+
+    - fingerprint (str): The SHA-256 hash (hexadecimal).
+    """
+    sha256 = hashlib.sha256()
+    sha256.update(json.dumps([feature_columns, hyperparameters], sort_keys=True).encode('utf-8'))
+    sha256.update(row_hashes.tobytes())
+    return sha256.hexdigest()
+
+def get_hyperparameters(path=hyperparameters_path):
+    """
+    Returns the hyperparameters of the classifier: the best ones found by get_best_hyperparameters, if any, or the
+    default ones otherwise.
+
+    Param:
+
+    - path (str): The path of the saved hyperparameters.
+
+    Return:
+
+    - hyperparameters (dict): The hyperparameters of the SGD classifier.
+    """
+    hyperparameters = dict(default_hyperparameters)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            hyperparameters.update(json.load(file))
+    except (OSError, ValueError):   # Not searched yet (or unreadable).
+        pass
+    return hyperparameters
@@ -2,14 +2,14 @@ import langid
 from collections import Counter
 import pandas as pd
 
-def refine(main_data, init_data, model_data, main_controller_name, show_model_attr, hide_model_attr, view_threshold=3, window_threshold=5):
+def refine(main_data, symbols, model_data, main_controller_name, show_model_attr, hide_model_attr, view_threshold=3, window_threshold=5):
     """
     Runs the refinement process.
 
     Param:
 
     - main_data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
     - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
     - main_controller_name (str): The name of the main Controller.
     - show_model_attr (bool): Indicates whether the attributes of Models are displayed in the view.
@@ -22,17 +22,65 @@ def refine(main_data, init_data, model_data, main_controller_name, show_model_at
     - refined_data (pandas.core.frame.DataFrame): The refined Controller data from the test dataset.
     - refined_model_data (pandas.core.frame.DataFrame): The refined Model data from the test dataset.
     """
+    model_index = get_model_index(model_data)  # Resolves the getters and return values of each Model once
     refined_data = set_languages(main_data)
     refined_data = set_methods_as_menu_buttons(refined_data, main_controller_name, view_threshold, window_threshold)
     refined_data = set_window_methods(refined_data, main_controller_name, window_threshold)
     refined_data = merge_arguments(refined_data)
     refined_data = merge_return_values(refined_data)
-    refined_data = set_widget_label(refined_data, init_data, model_data)
-    refined_data = set_widget_description(refined_data, init_data, model_data)
-    refined_data, refined_model_data = set_hide_show_model_attr(refined_data, init_data, model_data, show_model_attr, hide_model_attr)
+    refined_data = set_widget_label(refined_data, symbols, model_index)
+    refined_data = set_widget_description(refined_data, symbols, model_index)
+    refined_data, refined_model_data = set_hide_show_model_attr(refined_data, symbols, model_data, model_index, show_model_attr, hide_model_attr)
     refined_model_data = set_attr_description(refined_model_data)
     return refined_data, refined_model_data
 
+def get_model_index(model_data):
+    """
+    Indexes the Model data by Model, so that the methods of the Controllers that call a Model are linked to its getters
+    and return values with dictionary lookups.
+
+    Param:
+
+    - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
+
+    Return:
+
+    - model_index (dict): For each Model (indexed by its class name), a dictionary with its samples ('data'), the names of
+      the return values of each of its methods ('getters', indexed by the name of the method) and the names of its
+      methods which return a value ('return_values', in order).
+    """
+    model_index = {}
+    for class_name, class_data in model_data.groupby('ClassName', sort=False):
+        getters = {}
+        return_values = []
+        for row in class_data.itertuples():
+            if row.IsAMethod:
+                getters.setdefault(row.Name, row.ReturnValueNames)
+            if row.IsAReturnValue and row.BelongsTo not in return_values:
+                return_values.append(row.BelongsTo)
+        model_index[class_name] = {'data': class_data, 'getters': getters, 'return_values': return_values}
+    return model_index
+
+def get_model_attr_name(row, symbols, model_index):
+    """
+    Returns the name of the Model attribute that a method within the Controller returns by calling a Model passed as an
+    argument to its constructor (i.e. 'self.<model>.<getter>').
+
+    Param:
+
+    - row (tuple): The sample of the Controller data.
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
+    - model_index (dict): The Model data indexed by Model (see get_model_index).
+
+    Return:
+
+    - attr_name (str): The name of the Model attribute (blank if the getter does not return a named attribute).
+    """
+    _, model_name, getter = row.Name.split('.')[:3]
+    model_type = symbols.constructors[row.ClassName][model_name]
+    return_value_names = model_index.get(model_type, {}).get('getters', {}).get(getter)
+    return return_value_names[0].replace('self.', '') if return_value_names else ''
+
 def merge_arguments(data):
     """
     Joins samples of arguments that have the same name, data type, minimum and maximum values, default value,
@@ -53,13 +101,12 @@ def merge_arguments(data):
     arguments = data[data['Window'] == False]
 
     # Excludes IsAnArgument, IsAMethod, IsAReturnValue, BelongsTo and UsedByView columns (not essential to the argument
-    # joining process).
+    # joining process), along with the names and types of the arguments/return values of the methods.
 
     arguments = arguments[arguments['IsAnArgument'] == True].drop(columns=['IsAnArgument', 'IsAMethod', 'IsAReturnValue',
-                                                                           'BelongsTo', 'UsedByView'])
-    for i in range(1, 11):  # Also excludes ArgumentName<N> and ArgumentType<N> columns.
-        arguments = arguments.drop(columns=['ArgumentName' + str(i), 'ArgumentType' + str(i), 'ReturnValueName' + str(i),
-                                            'ReturnValueType' + str(i)])
+                                                                           'BelongsTo', 'UsedByView', 'ArgumentNames',
+                                                                           'ArgumentTypes', 'ReturnValueNames',
+                                                                           'ReturnValueTypes'])
 
     # Transform all rows into a single str to avoid ambiguity.
 
@@ -99,13 +146,12 @@ def merge_return_values(data):
     return_values = data[data['Window'] == False]
 
     # Excludes From, To, IsAnArgument, IsAMethod, IsAReturnValue, BelongsTo, DefaultValue, PossibleValues and UsedByView
-    # columns (not essential to the argument joining process).
+    # columns (not essential to the argument joining process), along with the names and types of the arguments/return
+    # values of the methods.
 
     return_values = return_values[return_values['IsAReturnValue'] == True].drop(columns=['From', 'To', 'IsAnArgument',
-                            'IsAMethod', 'IsAReturnValue', 'BelongsTo', 'DefaultValue', 'PossibleValues', 'UsedByView'])
-    for i in range(1, 11):  # Also excludes ReturnValueName<N> and ReturnValueType<N> columns.
-        return_values = return_values.drop(columns=['ArgumentName' + str(i), 'ArgumentType' + str(i), 'ReturnValueName'
-                                                    + str(i), 'ReturnValueType' + str(i)])
+                            'IsAMethod', 'IsAReturnValue', 'BelongsTo', 'DefaultValue', 'PossibleValues', 'UsedByView',
+                            'ArgumentNames', 'ArgumentTypes', 'ReturnValueNames', 'ReturnValueTypes'])
 
     # Transform all rows into a single str to avoid ambiguity.
 
@@ -177,35 +223,17 @@ def set_methods_as_menu_buttons(data, main_controller_name, view_threshold=3, wi
     if len(method_data['ClassName'].unique().tolist()) > view_threshold:
         method_data = method_data[method_data['ClassName'] == main_controller_name]
     for row in method_data.itertuples():    # For each method
-        arguments = []
-        return_values = []
+        arguments = row.ArgumentNames
+        return_values = row.ReturnValueNames
         _type = row.Type
-        i = 0
-        stop = False
-
-        # Checks if the number of arguments/return values is greater than the threshold value (window_threshold)
-
-        while i < 10 and not stop:
-            if method_data.loc[row.Index, 'ArgumentName' + str(i + 1)] == '':
-                stop = True
-            else:
-                arguments.append(method_data.loc[row.Index, 'ArgumentName' + str(i + 1)])
-                i += 1
-        j = 0
-        stop = False
-        while j < 10 and not stop:
-            if method_data.loc[row.Index, 'ReturnValueName' + str(j + 1)] == '':
-                stop = True
-            else:
-                return_values.append(method_data.loc[row.Index, 'ReturnValueName' + str(j + 1)])
-                j += 1
 
         # If it does not require any arguments/return values, it is automatically a Menubutton.
-        # Otherwise, it assigns when it exceeds the threshold restrictions.
+        # Otherwise, it assigns when the number of arguments/return values is greater than the threshold value
+        # (window_threshold).
 
-        if _type == 'None' and i == 0 and j == 0:
+        if _type == 'None' and not arguments and not return_values:
             new_data.at[row.Index, 'Widget'] = 'Menubutton'
-        elif i > window_threshold or j > window_threshold:
+        elif len(arguments) > window_threshold or len(return_values) > window_threshold:
             found_in_arguments = False
             k = 0
             while k < len(arguments) and not found_in_arguments:
@@ -225,7 +253,7 @@ def set_methods_as_menu_buttons(data, main_controller_name, view_threshold=3, wi
                 new_data.loc[new_data['BelongsTo'] == row.Name, 'Window'] = True
     return new_data
 
-def set_widget_label(data, init_data, model_data):
+def set_widget_label(data, symbols, model_index):
     """
     Creates a new column labeled WidgetLabel that corresponds to the nomenclature used by the developer in the
     implementation, but without special characters.
@@ -233,8 +261,8 @@ def set_widget_label(data, init_data, model_data):
     Param:
 
     - data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
-    - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
+    - model_index (dict): The Model data indexed by Model (see get_model_index).
 
     Return:
 
@@ -247,17 +275,8 @@ def set_widget_label(data, init_data, model_data):
     # the Controller returns.
 
     for row in new_data[new_data['WidgetLabel'].str.contains("self.")].itertuples():
-        index = init_data[init_data['ClassName'] == row.ClassName].index.to_list()[0]
-        i = 0
-        found = False
-        while init_data.loc[index, 'ArgumentName' + str(i + 1)] != '' and i < 10 and not found:
-            if init_data.loc[index, 'ArgumentName' + str(i + 1)] == row.Name.split('.')[1]:
-                found = True
-            else:
-                i += 1
-        if found:
-            index = model_data[model_data['Name'] == row.Name.split('.')[2]].index.to_list()[0]
-            new_data.loc[row.Index, 'WidgetLabel'] = model_data.loc[index, 'ReturnValueName1'].replace('self.', '')
+        if row.Name.split('.')[1] in symbols.constructors[row.ClassName]:
+            new_data.loc[row.Index, 'WidgetLabel'] = get_model_attr_name(row, symbols, model_index)
 
     # If the WidgetLabel column contains 'unnamed'.
 
@@ -314,7 +333,7 @@ def set_widget_label(data, init_data, model_data):
     new_data['WidgetLabel'] = new_data['WidgetLabel'].str[0].str.upper() + new_data['WidgetLabel'].str[1:]
     return new_data
 
-def set_widget_description(data, init_data, model_data):
+def set_widget_description(data, symbols, model_index):
     """
     Creates a new column labeled WidgetDescription that corresponds to the nomenclature used by the developer in the
     implementation, but without special characters.
@@ -322,8 +341,8 @@ def set_widget_description(data, init_data, model_data):
     Param:
 
     - data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
-    - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
+    - model_index (dict): The Model data indexed by Model (see get_model_index).
 
     Return:
 
@@ -336,17 +355,8 @@ def set_widget_description(data, init_data, model_data):
     # the Controller returns.
 
     for row in new_data[new_data['WidgetDescription'].str.contains("self.")].itertuples():
-        index = init_data[init_data['ClassName'] == row.ClassName].index.to_list()[0]
-        i = 0
-        found = False
-        while init_data.loc[index, 'ArgumentName' + str(i + 1)] != '' and i < 10 and not found:
-            if init_data.loc[index, 'ArgumentName' + str(i + 1)] == row.Name.split('.')[1]:
-                found = True
-            else:
-                i += 1
-        if found:
-            index = model_data[model_data['Name'] == row.Name.split('.')[2]].index.to_list()[0]
-            new_data.loc[row.Index, 'WidgetDescription'] = model_data.loc[index, 'ReturnValueName1'].replace('self.', '')
+        if row.Name.split('.')[1] in symbols.constructors[row.ClassName]:
+            new_data.loc[row.Index, 'WidgetDescription'] = get_model_attr_name(row, symbols, model_index)
 
     # If the WidgetDescription column contains 'unnamed'.
 
@@ -423,32 +433,14 @@ def set_window_methods(data, main_controller_name, window_threshold=5):
     method_data = method_data[method_data['ClassName'] != main_controller_name]
     method_data = method_data[method_data['Widget'] != 'Menubutton']
     for row in method_data.itertuples():
-        arguments = []
-        return_values = []
+        arguments = row.ArgumentNames
+        return_values = row.ReturnValueNames
         _type = row.Type
-        i = 0
-        stop = False
-
-        # Checks if the number of arguments/return values is greater than the threshold value (window_threshold)
-
-        while i < 10 and not stop:
-            if method_data.loc[row.Index, 'ArgumentName' + str(i + 1)] == '':
-                stop = True
-            else:
-                arguments.append(method_data.loc[row.Index, 'ArgumentName' + str(i + 1)])
-                i += 1
-        j = 0
-        stop = False
-        while j < 10 and not stop:
-            if method_data.loc[row.Index, 'ReturnValueName' + str(j + 1)] == '':
-                stop = True
-            else:
-                return_values.append(method_data.loc[row.Index, 'ReturnValueName' + str(j + 1)])
-                j += 1
-
-        # It assigns as a Window when it exceeds the threshold restrictions.
-
-        if i > window_threshold or j > window_threshold:
+
+        # It assigns as a Window when the number of arguments/return values is greater than the threshold value
+        # (window_threshold).
+
+        if len(arguments) > window_threshold or len(return_values) > window_threshold:
             found_in_arguments = False
             k = 0
             while k < len(arguments) and not found_in_arguments:
@@ -468,15 +460,16 @@ def set_window_methods(data, main_controller_name, window_threshold=5):
                 new_data.loc[new_data['BelongsTo'] == row.Name, 'Window'] = True
     return new_data
 
-def set_hide_show_model_attr(data, init_data, model_data, show_model_attr, hide_model_attr):
+def set_hide_show_model_attr(data, symbols, model_data, model_index, show_model_attr, hide_model_attr):
     """
     Returns those sample return values from Models that will be displayed in the graphical user interface.
 
     Param:
 
     - data (pandas.core.frame.DataFrame): Controller data from the test dataset.
-    - init_data (pandas.core.frame.DataFrame): Model and Controller constructors data from the test dataset (methods only).
+    - symbols (scanner.SymbolTable): The symbol table of the scanned classes (constructors and Models).
     - model_data (pandas.core.frame.DataFrame): Model data from the test dataset.
+    - model_index (dict): The Model data indexed by Model (see get_model_index).
     - show_model_attr (bool): Indicates whether the attributes of Models are displayed in the view.
     - hide_model_attr (bool): Indicates whether to hide Controller methods which return Model attributes.
 
@@ -486,74 +479,55 @@ def set_hide_show_model_attr(data, init_data, model_data, show_model_attr, hide_
     - new_model_data (pandas.core.frame.DataFrame): Model data from the test dataset with the new configuration.
     """
     new_data = data
-    aux_model_data = pd.DataFrame()
 
     # For each Model that is passed as an argument to any Controller constructor, we duplicate the data corresponding
     # to the methods/arguments/return values of the Model so that it can be determined if a Controller calls a Model
-    # with the same name that is passed as an argument to its constructor.
-
-    for index, row in init_data[init_data['UsedByView'] == True].iterrows():
-        i = 0
-        aux_data = pd.DataFrame()
-        while row['ArgumentName' + str(i + 1)] != '' and i < 10:
-            temp_data = model_data[model_data['ClassName'] == row['ArgumentType' + str(i + 1)]].copy()
-
-            # New column ModelName containing the name of the Model argument used by the Controller constructor.
-
-            temp_data['ModelName'] = row['ArgumentName' + str(i + 1)]
-            aux_data = pd.concat([aux_data, temp_data])
-            i += 1
-
-        # New column UsedByController that contains the name of the controller used by the Model along with ModelName.
-
-        aux_data['UsedByController'] = row['ClassName']
-        aux_model_data = pd.concat([aux_model_data, aux_data])
-    aux_model_data = aux_model_data.reset_index(drop=True)
-    new_model_data = aux_model_data
-    if not show_model_attr: # If the Models attribute are set to not be displayed (False).
-        for row in aux_model_data[aux_model_data['IsAReturnValue'] == True].itertuples():   # Hide everything
-            new_model_data = new_model_data[new_model_data['Name'] != row.BelongsTo]
-        if hide_model_attr: # If Controller methods which return Model attributes are set to hide (True).
-
-            # Finds out which methods return only one attribute of the Models and delete them from the Controller data.
-
-            for index, row in init_data[init_data['UsedByView'] == True].iterrows():
-                i = 0
-                while row['ArgumentName' + str(i + 1)] != '' and i < 10:
-                    aux_data = aux_model_data[aux_model_data['ClassName'] == row['ArgumentType' + str(i + 1)]]
-                    aux_data = aux_data[aux_data['UsedByController'] == row['ClassName']]
-                    aux_data = aux_data[aux_data['ModelName'] == row['ArgumentName' + str(i + 1)]]
-                    for row_aux in aux_data[aux_data['IsAReturnValue'] == True].itertuples():
-                        aux_data_2 = data[data['Name'] == "self." + row['ArgumentName' + str(i + 1)] + "." + row_aux.BelongsTo]
-                        aux_data_2 = aux_data_2[aux_data_2['ClassName'] == row['ClassName']]
-                        if aux_data_2.index.tolist():
-                            new_data = new_data[new_data['Name'] != aux_data_2.loc[aux_data_2.index.tolist()[0]]['BelongsTo']]
-                    i += 1
+    # with the same name that is passed as an argument to its constructor (new columns ModelName, containing the name
+    # of the Model argument used by the Controller constructor, and UsedByController, containing the name of the
+    # Controller).
+
+    model_frames = []
+    for controller in symbols.get_controllers():
+        for model_name, model_type in symbols.constructors[controller].items():
+            if model_type in model_index:
+                model_frames.append(model_index[model_type]['data'].assign(ModelName=model_name, UsedByController=controller))
+    if model_frames:
+        aux_model_data = pd.concat(model_frames).reset_index(drop=True)
+    else:
+        aux_model_data = model_data.iloc[0:0].assign(ModelName='', UsedByController='')
+
+    # Finds out which Controller methods return only one attribute of a Model (i.e. call 'self.<model>.<getter>' with
+    # the nomenclature assigned as an argument to its constructor), indexing the methods of each Controller by name.
+
+    controller_methods = {}
+    for row in data.itertuples():
+        controller_methods.setdefault((row.ClassName, row.Name), row.BelongsTo)
+    hidden_methods = set()
+    hidden_attrs = set()
+    for controller in symbols.get_controllers():
+        for model_name, model_type in symbols.constructors[controller].items():
+            for getter in model_index.get(model_type, {}).get('return_values', []):
+                method = controller_methods.get((controller, "self." + model_name + "." + getter))
+                if method is not None:
+                    hidden_methods.add(method)
+                    hidden_attrs.add((getter, controller, model_name))
+
+    # If Controller methods which return Model attributes are set to hide (True), they are deleted from the Controller
+    # data.
+
+    if hide_model_attr:
+        new_data = new_data[~new_data['Name'].isin(hidden_methods)]
+    if not show_model_attr: # If the Models attribute are set to not be displayed (False), hide everything.
+        getters = aux_model_data.loc[aux_model_data['IsAReturnValue'] == True, 'BelongsTo']
+        new_model_data = aux_model_data[~aux_model_data['Name'].isin(set(getters))]
     else:   # If the Models attribute are set to be displayed (True).
-        for index, row in init_data[init_data['UsedByView'] == True].iterrows():
-            i = 0
-            while row['ArgumentName' + str(i + 1)] != '' and i < 10:
-                aux_data = aux_model_data[aux_model_data['ClassName'] == row['ArgumentType' + str(i + 1)]]
-                aux_data = aux_data[aux_data['IsAReturnValue'] == True]
-                aux_data = aux_data[aux_data['UsedByController'] == row['ClassName']]
-                aux_data = aux_data[aux_data['ModelName'] == row['ArgumentName' + str(i + 1)]]
-                for row_aux in aux_data[aux_data['ClassName'] == row['ArgumentType' + str(i + 1)]].itertuples():
-                    aux_data_2 = data[data['Name'] == "self." + row['ArgumentName' + str(i + 1)] + "." + row_aux.BelongsTo]
-                    aux_data_2 = aux_data_2[aux_data_2['ClassName'] == row['ClassName']]
-                    if aux_data_2.index.tolist():
-
-                        # If Controller methods which return Model attributes are set to hide (True), finds out which
-                        # methods return only one attribute of the Models and delete them from the Controller data.
-
-                        if hide_model_attr:
-                            new_data = new_data[new_data['Name'] != aux_data_2.loc[aux_data_2.index.tolist()[0]]['BelongsTo']]
-
-                        # Deletes samples from return values of Models data if there is a Controller method which returns
-                        # the value of an attribute of a Model, exclusively by the Controller itself (UsedByController) and
-                        # with the nomenclature assigned as an argument to its constructor (ModelName).
-
-                        new_model_data = new_model_data[~((new_model_data['Name'] == row_aux.BelongsTo) & (new_model_data['UsedByController'] == row['ClassName']) & (new_model_data['ModelName'] == row['ArgumentName' + str(i + 1)]))]
-                i += 1
+
+        # Deletes samples from return values of Models data if there is a Controller method which returns the value of
+        # an attribute of a Model, exclusively by the Controller itself (UsedByController) and with the nomenclature
+        # assigned as an argument to its constructor (ModelName).
+
+        keys = zip(aux_model_data['Name'], aux_model_data['UsedByController'], aux_model_data['ModelName'])
+        new_model_data = aux_model_data[[key not in hidden_attrs for key in keys]]
     return new_data, new_model_data
 
 def set_attr_description(data):
@@ -1,63 +1,584 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 import ast
+import hashlib
+import os
+import pickle
 import sys
+import threading
+import numpy as np
 import pandas as pd
 
-data = []
+scan_cache_folder = os.path.join(os.getcwd(), 'cache', 'scan')  # Samples of the files scanned in previous runs (per project)
+scan_cache_version = 3   # Version of the scan cache format (older caches are discarded)
+parallel_threshold = 8  # Minimum number of files to scan them in a process pool
 float_min = -1.797693e+292
 float_max = 1.797693e+292
+primitive_types = {'int', 'float', 'bool', 'str', 'complex', 'list', 'tuple', 'set', 'dict'}   # Types of Model attributes
 
-def scan(source_code):
+class SampleBatch:
     """
-    Scans the source code and returns the test dataset.
+    Column buffers of a set of samples. Each sample is written directly into its columns (numeric and boolean ones use
+    typed buffers), and the names and types of the arguments/return values of the methods are stored in flat lists
+    with the offsets of each sample, so no list is created per sample.
+    """
+
+    __slots__ = ('name', 'type', '_from', 'to', 'is_an_argument', 'is_a_method', 'is_a_return_value', 'default_value',
+                 'possible_values', 'belongs_to', 'class_name', 'used_by_view', 'file_name', 'argument_offsets',
+                 'argument_names', 'argument_types', 'return_value_offsets', 'return_value_names', 'return_value_types')
+
+    def __init__(self):
+        self.name = []
+        self.type = []
+        self._from = array('d')
+        self.to = array('d')
+        self.is_an_argument = bytearray()
+        self.is_a_method = bytearray()
+        self.is_a_return_value = bytearray()
+        self.default_value = []
+        self.possible_values = []
+        self.belongs_to = []
+        self.class_name = []
+        self.used_by_view = bytearray()
+        self.file_name = []
+        self.argument_offsets = array('q', [0])
+        self.argument_names = []
+        self.argument_types = []
+        self.return_value_offsets = array('q', [0])
+        self.return_value_names = []
+        self.return_value_types = []
+
+    def __len__(self):
+        return len(self.name)
+
+    def add(self, name, _type, _from, to, is_an_argument, is_a_method, is_a_return_value, default_value, possible_values,
+            belongs_to, class_name, used_by_view, argument_names=(), argument_types=(), return_value_names=(),
+            return_value_types=()):
+        """
+        Adds a sample (its file name is assigned when the batch is merged into another one).
+
+        Param:
+
+        - name (str): Name of the method/argument/return value.
+        - _type (str): Data type of the method/argument/return value.
+        - _from (float): Minimum value of the argument.
+        - to (float): Maximum value of the argument.
+        - is_an_argument (bool): Indicates whether it is an argument.
+        - is_a_method (bool): Indicates whether it is a method.
+        - is_a_return_value (bool): Indicates whether it is a return value.
+        - default_value (int/float/bool/complex/str/list/tuple/set/dict): Default value of the argument (blank if none).
+        - possible_values (str): Possible values of the argument, separated by commas.
+        - belongs_to (str): Name of the method which the argument/return value belongs to.
+        - class_name (str): Name of the class which the method/argument/return value belongs to.
+        - used_by_view (bool): Indicates whether it has direct communication with the View.
+        - argument_names (list): Names of the arguments of the method.
+        - argument_types (list): Data types of the arguments of the method.
+        - return_value_names (list): Names of the return values of the method.
+        - return_value_types (list): Data types of the return values of the method.
+        """
+        self.name.append(name)
+        self.type.append(_type)
+        self._from.append(_from)
+        self.to.append(to)
+        self.is_an_argument.append(is_an_argument)
+        self.is_a_method.append(is_a_method)
+        self.is_a_return_value.append(is_a_return_value)
+        self.default_value.append(default_value)
+        self.possible_values.append(possible_values)
+        self.belongs_to.append(belongs_to)
+        self.class_name.append(class_name)
+        self.used_by_view.append(used_by_view)
+        self.argument_names += argument_names
+        self.argument_types += argument_types
+        self.argument_offsets.append(len(self.argument_names))
+        self.return_value_names += return_value_names
+        self.return_value_types += return_value_types
+        self.return_value_offsets.append(len(self.return_value_names))
+
+    def extend(self, batch, file_name):
+        """
+        Adds the samples of another batch, assigning them the name of the file they come from.
+
+        Param:
+
+        - batch (SampleBatch): The batch to add.
+        - file_name (str): The name of the file the samples of the batch come from.
+        """
+        for column in ['name', 'type', '_from', 'to', 'is_an_argument', 'is_a_method', 'is_a_return_value',
+                       'default_value', 'possible_values', 'belongs_to', 'class_name', 'used_by_view',
+                       'argument_names', 'argument_types', 'return_value_names', 'return_value_types']:
+            getattr(self, column).extend(getattr(batch, column))
+        self.file_name += [file_name] * len(batch)
+        shift = self.argument_offsets[-1]
+        self.argument_offsets.extend(offset + shift for offset in batch.argument_offsets[1:])
+        shift = self.return_value_offsets[-1]
+        self.return_value_offsets.extend(offset + shift for offset in batch.return_value_offsets[1:])
+
+    def to_dataframe(self):
+        """
+        Returns the samples as a test dataset, handing the columns to pandas directly.
+
+        Return:
+
+        - test_data (pandas.core.frame.DataFrame): The test dataset.
+        """
+        columns = {
+            'Name': self.name,
+            'Type': self.type,
+            'From': np.frombuffer(self._from, dtype=np.float64).copy(),
+            'To': np.frombuffer(self.to, dtype=np.float64).copy(),
+            'IsAnArgument': np.frombuffer(self.is_an_argument, dtype=np.bool_).copy(),
+            'IsAMethod': np.frombuffer(self.is_a_method, dtype=np.bool_).copy(),
+            'IsAReturnValue': np.frombuffer(self.is_a_return_value, dtype=np.bool_).copy()
+        }
+
+        # The names and types of the arguments/return values are sliced out of the flat lists as one tuple per sample
+        # (the samples without them share the same empty tuple).
+
+        for prefix, offsets, names, types in [('Argument', self.argument_offsets, self.argument_names, self.argument_types),
+                                              ('ReturnValue', self.return_value_offsets, self.return_value_names,
+                                               self.return_value_types)]:
+            bounds = list(zip(offsets, offsets[1:]))
+            columns[prefix + 'Names'] = ragged_column(names, bounds)
+            columns[prefix + 'Types'] = ragged_column(types, bounds)
+        columns['DefaultValue'] = self.default_value
+        columns['PossibleValues'] = self.possible_values
+        columns['BelongsTo'] = self.belongs_to
+        columns['ClassName'] = self.class_name
+        columns['UsedByView'] = np.frombuffer(self.used_by_view, dtype=np.bool_).copy()
+        columns['FileName'] = self.file_name if len(self.file_name) == len(self) else [''] * len(self)
+        test_data = pd.DataFrame(columns, columns=get_labels() + ['FileName'])
+        return test_data
+
+def ragged_column(values, bounds):
+    """
+    Builds a column of variable-length tuples out of a flat list of values.
+
+    Param:
+
+    - values (list): The flat list of values.
+    - bounds (list): The start and end position (in the flat list) of the values of each sample.
+
+    Return:
+
+    - column (numpy.ndarray): The column, with one tuple per sample.
+    """
+    column = np.empty(len(bounds), dtype=object)
+    column[:] = [tuple(values[start:end]) if start < end else () for start, end in bounds]
+    return column
+
+class ScanSession:
+    """
+    Scanning session, which owns its sample buffer and the record of the files it has scanned. Each session is
+    independent, so several projects can be scanned at the same time (e.g. from different threads) in the same process.
+
+    Attributes:
+
+    - data (SampleBatch): The sample buffer where the traversal of the syntax tree adds the samples.
+    - scanned_files (dict): Version (modification time and size), hash and segments of each scanned file, indexed by its path.
+    - cache_folder (str): The folder of the scan cache files (one per project, see get_scan_cache_path).
+    """
+
+    def __init__(self, cache_folder=scan_cache_folder):
+        self.data = SampleBatch()
+        self.scanned_files = {}
+        self.cache_folder = cache_folder
+
+    def scan(self, source_code, file_name=''):
+        """
+        Scans the source code and returns the test dataset.
+
+        Param:
+
+        - source_code (str): The whole source code.
+        - file_name (str): The name of the file the source code comes from (default is blank).
+
+        Return:
+
+        - test_data (pandas.core.frame.DataFrame): The whole test dataset.
+        """
+        tree = ast.parse(source_code) # Obtaining the root node to traverse the syntax tree.
+        SampleVisitor(self.data).visit(tree)
+        batch = SampleBatch()
+        batch.extend(self.data, file_name)
+        self.data = SampleBatch()   # The buffer is emptied so that the next scan does not return duplicated samples.
+        return batch.to_dataframe()
+
+    def iter_scan(self, source_code, file_name=''):
+        """
+        Scans the source code lazily, yielding the samples of each class as soon as it has been traversed, so that they
+        can be consumed (e.g. classified or written to disk) while the rest of the code is being scanned.
+
+        Param:
+
+        - source_code (str): The whole source code.
+        - file_name (str): The name of the file the source code comes from (default is blank).
+
+        Return:
+
+        - batches (generator): The samples of each statement of the module which has any (i.e. of each class, along
+          with the classes defined inside it), as SampleBatch objects.
+        """
+        tree = ast.parse(source_code) # Obtaining the root node to traverse the syntax tree.
+        for node in tree.body:
+            SampleVisitor(self.data).visit(node)
+            if len(self.data):
+                batch = SampleBatch()
+                batch.extend(self.data, file_name)
+                self.data = SampleBatch()   # Each batch is handed over, so only one class is held at a time.
+                yield batch
+
+    def iter_scan_files(self, file_paths):
+        """
+        Scans the source code files one by one lazily, yielding the samples of each class tagged with the name of the
+        file it comes from (see iter_scan). Only the file being scanned is kept in memory, so neither the scan cache nor
+        the process pool are used.
+
+        Param:
+
+        - file_paths (list): List of source code file paths.
+
+        Return:
+
+        - batches (generator): The samples of each class, as SampleBatch objects, in order of appearance.
+        """
+        for file_path in file_paths:
+            with open(file_path, "r", encoding="utf-8") as file:
+                source_code = file.read()
+            yield from self.iter_scan(source_code, os.path.basename(file_path))
+
+    def scan_files(self, file_paths, max_workers=None):
+        """
+        Scans each source code file on its own and returns the test dataset, where each sample is tagged with the name
+        of the file it comes from. Files that have not changed since the last run of the session are neither read nor
+        parsed again, and only the classes that changed inside a modified file are traversed (see the scan cache).
+        When there are enough files to scan, they are distributed among several processes.
+
+        Param:
+
+        - file_paths (list): List of source code file paths.
+        - max_workers (int): The maximum number of processes used to scan the files (default is the number of CPUs).
+
+        Return:
+
+        - test_data (pandas.core.frame.DataFrame): The whole test dataset.
+        """
+        cache_path = get_scan_cache_path(file_paths, self.cache_folder)
+        scan_cache = load_scan_cache(cache_path)
+        pending = []    # Files which have to be scanned (path, version, hash and source code).
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+            if file_path not in self.scanned_files or self.scanned_files[file_path][0] != version:
+                with open(file_path, "r", encoding="utf-8") as file:
+                    source_code = file.read()
+                digest = get_hash(source_code)
+                if digest in scan_cache:    # Same content as in a previous run (e.g. the file has only been touched).
+                    self.scanned_files[file_path] = (version, digest, scan_cache[digest])
+                else:
+                    pending.append((file_path, version, digest, source_code))
+        if pending:
+            for (file_path, version, digest, _), segments in zip(pending, self.scan_pending(pending, scan_cache, max_workers)):
+                self.scanned_files[file_path] = (version, digest, segments)
+
+        # The samples are merged following the order of the files, regardless of how they were scanned.
+
+        new_scan_cache = {}
+        batch = SampleBatch()
+        for file_path in file_paths:
+            _, digest, segments = self.scanned_files[file_path]
+            new_scan_cache[digest] = segments
+            for _, segment in segments:
+                batch.extend(segment, os.path.basename(file_path))
+        if new_scan_cache.keys() != scan_cache.keys():  # The entries are indexed by content, so comparing hashes is enough.
+            save_scan_cache(new_scan_cache, cache_path)
+        return batch.to_dataframe()
+
+    def scan_pending(self, pending, scan_cache, max_workers=None):
+        """
+        Scans the files whose samples are not found in the scan cache, in a process pool if there are enough of them.
+        Each process only receives the hashes of the cached classes, and returns a compact list of segments where the
+        samples of those classes are left empty (they are filled in here).
+
+        Param:
+
+        - pending (list): List of (path, version, hash, source code) tuples of the files to scan.
+        - scan_cache (dict): The scan cache.
+        - max_workers (int): The maximum number of processes used to scan the files (default is the number of CPUs).
+
+        Return:
+
+        - file_segments (list): The segments of each file, in the same order as pending.
+        """
+        cached_classes = {d: batch for segments in scan_cache.values() for d, batch in segments if d}
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if len(pending) < parallel_threshold or max_workers < 2:  # Few files do not pay the cost of a process pool.
+            return [self.scan_segments(source_code, cached_classes) for _, _, _, source_code in pending]
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(pending)), initializer=init_scan_worker,
+                                 initargs=(set(cached_classes),)) as executor:
+            file_segments = list(executor.map(scan_worker, [source_code for _, _, _, source_code in pending]))
+        return [[(d, cached_classes[d] if batch is None else batch) for d, batch in segments] for segments in file_segments]
+
+    def scan_segments(self, source_code, cached_classes):
+        """
+        Scans the source code of a single file, split into segments (one per statement of the module). The samples of
+        the classes whose source code is found in the cache are reused instead of traversing them again.
+
+        Param:
+
+        - source_code (str): The source code of the file.
+        - cached_classes (dict): Samples of the classes scanned in previous runs, indexed by the hash of their source code.
+
+        Return:
+
+        - segments (list): List of (hash, SampleBatch) tuples in order of appearance (the hash is None if it is not a class).
+        """
+        segments = []
+        tree = ast.parse(source_code) # Obtaining the root node to traverse the syntax tree.
+        lines = source_code.split('\n')    # The lines are split once (ast.get_source_segment does it on every call).
+        for node in tree.body:
+            digest = None
+            if isinstance(node, ast.ClassDef):
+                digest = get_hash('\n'.join(lines[node.lineno - 1:node.end_lineno]))
+                if digest in cached_classes:
+                    segments.append((digest, cached_classes[digest]))
+                    continue
+            SampleVisitor(self.data).visit(node)
+            segments.append((digest, self.data))
+            self.data = SampleBatch()
+        return segments
+
+default_session = ScanSession()    # Session used by scan_files when none is given (e.g. by the main window)
+worker_cached_classes = {}  # Hashes of the cached classes, known by each scanning process (see init_scan_worker)
+
+def init_scan_worker(cached_digests):
+    """
+    Initializes a scanning process with the hashes of the classes whose samples are already cached.
+
+    Param:
+
+    - cached_digests (set): The hashes of the cached classes.
+    """
+    global worker_cached_classes
+    worker_cached_classes = dict.fromkeys(cached_digests)
+
+def scan_worker(source_code):
+    """
+    Scans the source code of a single file inside a scanning process.
+
+    Param:
+
+    - source_code (str): The source code of the file.
+
+    Return:
+
+    - segments (list): List of (hash, samples) tuples (the samples of cached classes are None).
+    """
+    return ScanSession(cache_folder=None).scan_segments(source_code, worker_cached_classes)
+
+def scan(source_code, file_name=''):
+    """
+    Scans the source code and returns the test dataset (each call uses its own session, so it is reentrant).
 
     Param:
 
     - source_code (str): The whole source code.
+    - file_name (str): The name of the file the source code comes from (default is blank).
+
+    Return:
+
+    - test_data (pandas.core.frame.DataFrame): The whole test dataset.
+    """
+    return ScanSession().scan(source_code, file_name)
+
+def iter_scan(source_code, file_name=''):
+    """
+    Scans the source code lazily, yielding the samples of each class (see ScanSession.iter_scan).
+
+    Param:
+
+    - source_code (str): The whole source code.
+    - file_name (str): The name of the file the source code comes from (default is blank).
+
+    Return:
+
+    - batches (generator): The samples of each class, as SampleBatch objects.
+    """
+    return ScanSession().iter_scan(source_code, file_name)
+
+def iter_scan_files(file_paths):
+    """
+    Scans the source code files lazily, yielding the samples of each class (see ScanSession.iter_scan_files).
+
+    Param:
+
+    - file_paths (list): List of source code file paths.
+
+    Return:
+
+    - batches (generator): The samples of each class, as SampleBatch objects.
+    """
+    return ScanSession().iter_scan_files(file_paths)
+
+def scan_files(file_paths, session=None, max_workers=None):
+    """
+    Scans each source code file on its own and returns the test dataset (see ScanSession.scan_files).
+
+    Param:
+
+    - file_paths (list): List of source code file paths.
+    - session (ScanSession): The session used to scan the files (default is the session shared by the process, which
+      should not be used by several threads at the same time).
+    - max_workers (int): The maximum number of processes used to scan the files (default is the number of CPUs).
 
     Return:
 
     - test_data (pandas.core.frame.DataFrame): The whole test dataset.
     """
-    tree = ast.parse(source_code) # Obtaining the root node to traverse the syntax tree.
-    walk(tree, '', False, False)
+    if session is None:
+        session = default_session
+    return session.scan_files(file_paths, max_workers)
+
+def get_hash(source_code):
+    """
+    Computes the hash of a piece of source code.
+
+    Param:
+
+    - source_code (str): The source code.
+
+    Return:
+
+    - digest (str): The SHA-256 hash of the source code (hexadecimal).
+    """
+    return hashlib.sha256(source_code.encode('utf-8')).hexdigest()
+
+def get_scan_cache_path(file_paths, folder=scan_cache_folder):
+    """
+    Returns the path of the scan cache of a project, named after the folder which contains its source code files and
+    the hash of its full path, so that scanning different projects (or folders) does not evict each other's entries.
+
+    Param:
+
+    - file_paths (list): List of source code file paths of the project.
+    - folder (str): The folder of the scan cache files.
+
+    Return:
+
+    - cache_path (str): The path of the scan cache file.
+    """
+    if file_paths:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(file_path)) for file_path in file_paths])
+    else:
+        root = os.getcwd()
+    name = os.path.basename(root) or 'root'
+    digest = hashlib.sha256(root.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(folder, name + '-' + digest + '.pkl')
+
+def load_scan_cache(cache_path):
+    """
+    Loads the scan cache of a project, which stores the segments of each file scanned in its last run, indexed by the
+    hash of the file content.
+
+    Param:
+
+    - cache_path (str): The path of the scan cache file.
+
+    Return:
+
+    - scan_cache (dict): The scan cache (empty if it does not exist or cannot be read).
+    """
+    scan_cache = {}
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, "rb") as file:
+                version, scan_cache = pickle.load(file)
+            if version != scan_cache_version:
+                scan_cache = {}
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):  # A damaged cache is rebuilt.
+            scan_cache = {}
+    return scan_cache
+
+def save_scan_cache(scan_cache, cache_path):
+    """
+    Saves the scan cache of a project (only the files of its current scan are kept, so it does not grow indefinitely).
+    The file is written under a temporary name and then replaced, so concurrent sessions never read a half-written
+    cache.
+
+    Param:
+
+    - scan_cache (dict): The scan cache.
+    - cache_path (str): The path of the scan cache file.
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = cache_path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.tmp'
+    with open(temp_path, "wb") as file:
+        pickle.dump((scan_cache_version, scan_cache), file)
+    os.replace(temp_path, cache_path)
+
+def get_labels():
+    """
+    Returns the column labels shared by the test and training datasets (the test dataset adds the FileName column at
+    the end, while the training dataset adds the Widget column).
+
+    Return:
+
+    - labels (list): The ordered list of column labels.
+    """
     labels = ['Name', 'Type', 'From', 'To', 'IsAnArgument', 'IsAMethod', 'IsAReturnValue']
-    for i in range(1, 11):
-        labels.append('ArgumentName' + str(i))
-        labels.append('ArgumentType' + str(i))
-    for i in range(1, 11):
-        labels.append('ReturnValueName' + str(i))
-        labels.append('ReturnValueType' + str(i))
+    labels.append('ArgumentNames')    # Tuples with the names/types of the arguments/return values (any number of them)
+    labels.append('ArgumentTypes')
+    labels.append('ReturnValueNames')
+    labels.append('ReturnValueTypes')
     labels.append('DefaultValue')
     labels.append('PossibleValues')
     labels.append('BelongsTo')
     labels.append('ClassName')
     labels.append('UsedByView')
-    test_data = pd.DataFrame(data, columns=labels)
-    return test_data
+    return labels
 
-def walk(node, name, is_a_class, is_not_a_model):
+class SampleVisitor(ast.NodeVisitor):
     """
-    Traverses the syntax tree recursively.
+    Traverses the syntax tree in a single pass, dispatching on the type of each node, and adds the samples of the
+    methods found inside classes (and those of their arguments/return values) to a sample buffer.
 
-    Param:
+    Attributes:
 
-    - node (ast.Module): A node of the syntax tree.
-    - name (str): The name of the class in which the current node is located.
+    - data (SampleBatch): The sample buffer of the scanning session.
+    - class_name (str): The name of the class in which the current node is located.
     - is_a_class (bool): Indicates whether the current node is inside a class or not.
     - is_not_a_model (bool): Indicates if the class in which the current node is located is not a Model.
     """
-    if "FunctionDef" in str(node) and is_a_class:   # If it is a method and it is inside a class, we get its sample
-        data.append(get_method_sample(node, name, is_not_a_model))  # Adds the sample to the main dataset
-    else:   # Otherwise, traverse the tree until it finds a function within a class
-        children = list(ast.iter_child_nodes(node))
-        for child in children:
 
-            # If one of the children is a class, saves its name, indicates that it is and checks that it is not a Model.
+    def __init__(self, data, class_name='', is_a_class=False, is_not_a_model=False):
+        self.data = data
+        self.class_name = class_name
+        self.is_a_class = is_a_class
+        self.is_not_a_model = is_not_a_model
+
+    def visit_ClassDef(self, node):
+        # Saves the name of the class, indicates that it is one and checks that it is not a Model.
+
+        outer_class = (self.class_name, self.is_a_class, self.is_not_a_model)
+        self.class_name, self.is_a_class, self.is_not_a_model = node.name, True, check(node)
+        self.generic_visit(node)
+        self.class_name, self.is_a_class, self.is_not_a_model = outer_class
+
+    def visit_FunctionDef(self, node):
+        if self.is_a_class: # If it is a method, we get its sample (its body is not traversed).
+            get_method_sample(node, self.class_name, self.is_not_a_model, self.data)
+        else:   # Otherwise, keeps looking for classes inside the function.
+            self.generic_visit(node)
 
-            if "ClassDef" in str(child):
-                walk(child, child.__dict__['name'], True, check(child))
-            else:
-                walk(child, name, is_a_class, is_not_a_model)
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def generic_visit(self, node):
+        # Classes and methods can only be found among statements, so expressions are not traversed.
+
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                self.visit(child)
 
 def check(node):
     """
@@ -71,183 +592,259 @@ def check(node):
 
     - found (bool): Indicate if it is not a Model (otherwise False).
     """
-    i = 0
-    function = None
-    found = False
 
-    # First, the function definition is obtained within the grammar by traversing the body of the class.
+    # A Model receives at least one argument of the data types indicated in primitive_types in its constructor.
 
-    while i < len(node.__dict__['body']) and not found:
-        if node.__dict__['body'][i].__dict__['name'] == '__init__':
-            function = node.__dict__['body'][i]
-            found = True
-        else:
-            i += 1
-    found = True
-
-    # Once it is obtained, checks that the data types of the arguments correspond to those indicated below.
-
-    while i < len(function.__dict__['args'].__dict__['args']) and found:
-        if function.__dict__['args'].__dict__['args'][i].__dict__['arg'] != 'self':
-            match function.__dict__['args'].__dict__['args'][i].__dict__['annotation'].__dict__['id']:
-                case 'int' | 'float' | 'bool' | 'str' | 'complex' | 'list' | 'tuple' | 'set' | 'dict':
-                    found = False
-                case _:
-                    i += 1
-        else:
-            i += 1
-    return found
+    for argument in get_constructor_arguments(node):
+        if isinstance(argument.annotation, ast.Name) and argument.annotation.id in primitive_types:
+            return False
+    return True
 
-def get_method_sample(node, class_name, is_not_a_model):
+def get_constructor_arguments(node):
     """
-    Adds the sample of the method which current node corresponds.
+    Returns the arguments of the constructor of a class (except self argument).
 
     Param:
 
-    - node (ast.Module): A node of the syntax tree.
-    - class_name (str): The name of the class in which the current node is located.
-    - is_not_a_model (bool): Indicates if the class in which the current node is located is not a Model.
+    - node (ast.ClassDef): A node of the syntax tree that is a class.
 
     Return:
 
-    - function_sample (list): List of sample characteristics of the corresponding method.
+    - arguments (list): The arguments of the constructor (empty if it has none).
+    """
+    for statement in node.body:
+        if isinstance(statement, ast.FunctionDef) and statement.name == '__init__':
+            return [argument for argument in statement.args.args if argument.arg != 'self']
+    return []
+
+class SymbolTable:
+    """
+    Classes of the scanned source code, with the arguments of their constructors and whether they are Models, so that
+    the relationships between Models and Controllers are resolved with dictionary lookups.
+
+    Attributes:
+
+    - constructors (dict): The arguments of the constructor of each class (a dictionary with the data type of each
+      argument, indexed by its name, in order), indexed by the name of the class.
+    - models (set): The names of the classes which are Models.
+    - file_names (dict): The name of the file which each class belongs to, indexed by the name of the class.
+    """
+
+    __slots__ = ('constructors', 'models', 'file_names')
+
+    def __init__(self):
+        self.constructors = {}
+        self.models = set()
+        self.file_names = {}
+
+    def add_class(self, class_name, arguments, is_a_model, file_name=''):
+        """
+        Adds a class (if a class is defined more than once, the first definition is kept).
+
+        Param:
+
+        - class_name (str): The name of the class.
+        - arguments (dict): The data type of each argument of its constructor, indexed by its name.
+        - is_a_model (bool): Indicates whether it is a Model.
+        - file_name (str): The name of the file which the class belongs to (default is blank).
+        """
+        if class_name not in self.constructors:
+            self.constructors[class_name] = arguments
+            self.file_names[class_name] = file_name
+            if is_a_model:
+                self.models.add(class_name)
+
+    def get_controllers(self):
+        """
+        Returns the names of the classes which are not Models (i.e. the Controllers), in order of appearance.
+
+        Return:
+
+        - controllers (list): The names of the Controllers.
+        """
+        return [class_name for class_name in self.constructors if class_name not in self.models]
+
+def get_symbol_table(test_data):
+    """
+    Builds the symbol table of the scanned classes from the samples of their constructors.
+
+    Param:
+
+    - test_data (pandas.core.frame.DataFrame): The test dataset (with the samples of the constructors).
+
+    Return:
+
+    - symbols (SymbolTable): The symbol table.
+    """
+    symbols = SymbolTable()
+    init_data = test_data[(test_data['Name'] == '__init__') & (test_data['IsAMethod'] == True)]
+    file_names = init_data['FileName'] if 'FileName' in init_data.columns else [''] * len(init_data)
+    for row, file_name in zip(init_data.itertuples(), file_names):
+        symbols.add_class(row.ClassName, dict(zip(row.ArgumentNames, row.ArgumentTypes)), not row.UsedByView, file_name)
+    return symbols
+
+def get_method_sample(node, class_name, is_not_a_model, data):
+    """
+    Adds the sample of the method which current node corresponds to the sample buffer, right after the samples of its
+    arguments and return values.
+
+    Param:
+
+    - node (ast.Module): A node of the syntax tree.
+    - class_name (str): The name of the class in which the current node is located.
+    - is_not_a_model (bool): Indicates if the class in which the current node is located is not a Model.
+    - data (SampleBatch): The sample buffer of the scanning session.
     """
-    function_sample = [node.__dict__['name']]   # Name
 
     # If it is a method that returns more than one value, the data type referring to the tuple of return values
     # is obtained.
 
-    if node.__dict__['returns']:
-        if 'slice' in node.__dict__['returns'].__dict__:
-            function_sample.append(node.__dict__['returns'].__dict__['value'].__dict__['id'])
+    if node.returns:
+        if isinstance(node.returns, ast.Subscript):
+            _type = node.returns.value.id
         else:
-            function_sample.append(node.__dict__['returns'].__dict__['id'])
+            _type = node.returns.id
     else:   # If no value is returned, it defaults to None.
-        function_sample.append(str(node.__dict__['returns']))
-
-    function_sample.append(float_min)   # From.
-    function_sample.append(float_max)   # To.
-    function_sample.append(False)       # IsAnArgument.
-    function_sample.append(True)        # IsAMethod.
-    function_sample.append(False)       # IsAReturnValue.
+        _type = str(node.returns)
 
-    # Save the argument names to a list
+    # Save the arguments to a list (except self argument).
 
-    arguments = []
-    for argument in node.__dict__['args'].__dict__['args']:
-        if argument.__dict__['arg'] != 'self':  # Except self argument.
-            arguments.append(argument)
-    while len(arguments) < 10:  # The remaining features that are not associated with any argument are None.
-        arguments.append(None)
+    arguments = [argument for argument in node.args.args if argument.arg != 'self']
 
     # The list of default values is obtained (if applicable to its argument).
 
     defaults = []
     default_index = 0
-    for default in node.__dict__['args'].__dict__['defaults']:
-        defaults.append(default.__dict__['value'])
+    for default in node.args.defaults:
+        defaults.append(default.value)
 
-    # The list of assertions found is obtained through the following method.
+    # The constraints of the arguments are obtained from the assertions through the following method.
 
-    asserts = look_for_asserts(node)
+    constraints = look_for_asserts(node)
+    argument_names = []
+    argument_types = []
     for argument in arguments:  # For each argument the name and associated type are saved.
-        if not argument:    # If there is no information, leave it blank.
-            function_sample.append('')
-            function_sample.append('None')
-        else:   # Otherwise checks whether this is an argument with a default value or not.
-            function_sample.append(argument.__dict__['arg'])
-            if argument.__dict__['annotation']:
-                function_sample.append(argument.__dict__['annotation'].__dict__['id'])
-                if node.__dict__['name'] != '__init__':
-                    data.append(get_argument_sample(argument, class_name,None, asserts,
-                                                    node.__dict__['name'], is_not_a_model))
-            else:
-                function_sample.append(type(defaults[default_index]).__name__)
-                if node.__dict__['name'] != '__init__':
-                    data.append(get_argument_sample(argument, class_name, defaults[default_index], asserts,
-                                                    node.__dict__['name'], is_not_a_model))
-                default_index += 1
+        argument_names.append(argument.arg)
+
+        # Checks whether this is an argument with a default value or not.
+
+        if argument.annotation:
+            argument_types.append(argument.annotation.id)
+            if node.name != '__init__':
+                get_argument_sample(argument, class_name, None, constraints, node.name, is_not_a_model, data)
+        else:
+            argument_types.append(type(defaults[default_index]).__name__)
+            if node.name != '__init__':
+                get_argument_sample(argument, class_name, defaults[default_index], constraints, node.name, is_not_a_model,
+                                    data)
+            default_index += 1
 
     # If the method has return values, saves the name and data type for each one.
 
-    if node.__dict__['returns']:
-        if 'slice' in node.__dict__['returns'].__dict__:
+    return_value_names = []
+    return_value_types = []
+    if node.returns:
+        if isinstance(node.returns, ast.Subscript):
 
             # If it returns more than single value, iterates over each one.
 
             j = 0
-            for return_value in node.__dict__['body'][-1].__dict__['value'].__dict__['elts']:
-                if "Name" in str(return_value): # Variable name?
-                    function_sample.append(str(return_value.__dict__['id']))
-                    function_sample.append(node.__dict__['returns'].__dict__['slice'].__dict__['elts'][j].__dict__['id'])
-                    data.append(get_return_value_sample(str(return_value.__dict__['id']),
-                                                        class_name,
-                                                  node.__dict__['returns'].__dict__['slice'].__dict__['elts'][j].__dict__['id'],
-                                                        node.__dict__['name'], is_not_a_model))
-                elif "Call" in str(return_value):   # Calls to a Model method?
-                    aux_name = return_value.__dict__['func'].__dict__['value'].__dict__['value'].__dict__['id']
-                    aux_name += '.' + return_value.__dict__['func'].__dict__['value'].__dict__['attr']
-                    aux_name += '.' + return_value.__dict__['func'].__dict__['attr']
-                    function_sample.append(aux_name)
-                    function_sample.append(node.__dict__['returns'].__dict__['slice'].__dict__['elts'][j].__dict__['id'])
-                    data.append(get_return_value_sample(aux_name, class_name,
-                    node.__dict__['returns'].__dict__['slice'].__dict__['elts'][j].__dict__['id'], node.__dict__['name'],
-                                                        is_not_a_model))
-                elif "Constant" in str(return_value):   # Constant value?
-                    function_sample.append("unnamed_" + str(return_value.__dict__['value']))
-                    function_sample.append(type(return_value.__dict__['value']).__name__)
-                    data.append(get_return_value_sample("unnamed_" + str(return_value.__dict__['value']), class_name,
-                                                  type(return_value.__dict__['value']).__name__, node.__dict__['name'],
-                                                        is_not_a_model))
+            for return_value in node.body[-1].value.elts:
+                name = None
+                if isinstance(return_value, ast.Name): # Variable name?
+                    name = str(return_value.id)
+                    return_value_type = node.returns.slice.elts[j].id
+                elif isinstance(return_value, ast.Call):   # Calls to a Model method?
+                    name = return_value.func.value.value.id
+                    name += '.' + return_value.func.value.attr
+                    name += '.' + return_value.func.attr
+                    return_value_type = node.returns.slice.elts[j].id
+                elif isinstance(return_value, ast.Constant):   # Constant value?
+                    name = "unnamed_" + str(return_value.value)
+                    return_value_type = type(return_value.value).__name__
+                if name is not None:
+                    return_value_names.append(name)
+                    return_value_types.append(return_value_type)
+                    get_return_value_sample(name, class_name, return_value_type, node.name, is_not_a_model, data)
                 j += 1
-            for i in range(j, 10):  # The remaining features that are not associated with any return value are None
-                function_sample.append('')
-                function_sample.append('None')
         else:
-            aux_return = node.__dict__['body'][-1]
-            if "Name" in str(aux_return.__dict__['value']): # Variable name?
-                function_sample.append(str(aux_return.__dict__['value'].__dict__['id']))
-                data.append(get_return_value_sample(str(aux_return.__dict__['value'].__dict__['id']), class_name,
-                                              node.__dict__['returns'].__dict__['id'], node.__dict__['name'],
-                                                    is_not_a_model))
-            elif "Call" in str(aux_return.__dict__['value']):   # Calls to a Model method?
-                aux_name = aux_return.__dict__['value'].__dict__['func'].__dict__['value'].__dict__['value'].__dict__['id']
-                aux_name += '.' + aux_return.__dict__['value'].__dict__['func'].__dict__['value'].__dict__['attr']
-                aux_name += '.' + aux_return.__dict__['value'].__dict__['func'].__dict__['attr']
-                function_sample.append(aux_name)
-                data.append(get_return_value_sample(aux_name, class_name, node.__dict__['returns'].__dict__['id'],
-                                                    node.__dict__['name'], is_not_a_model))
-            elif "Constant" in str(aux_return.__dict__['value']):   # Constant value?
-                function_sample.append("unnamed_" + str(aux_return.__dict__['value'].__dict__['value']))
-                data.append(get_return_value_sample("unnamed_" + str(aux_return.__dict__['value'].__dict__['value']),
-                                                    class_name, node.__dict__['returns'].__dict__['id'], node.__dict__['name'],
-                                                    is_not_a_model))
-            elif "Attribute" in str(aux_return.__dict__['value']):  # Attribute?
-                aux_name = aux_return.__dict__['value'].__dict__['value'].__dict__['id']
-                aux_name += '.' + aux_return.__dict__['value'].__dict__['attr']
-                function_sample.append(aux_name)
-                data.append(get_return_value_sample(aux_name, class_name, node.__dict__['returns'].__dict__['id'],
-                                                    node.__dict__['name'], is_not_a_model))
-            function_sample.append(node.__dict__['returns'].__dict__['id'])
-            for i in range(1, 10):  # The remaining features that are not associated with any return value are None
-                function_sample.append('')
-                function_sample.append('None')
-    else:
-        for i in range(10):
-            function_sample.append('')
-            function_sample.append('None')
+            aux_return = node.body[-1]
+            name = None
+            if isinstance(aux_return.value, ast.Name): # Variable name?
+                name = str(aux_return.value.id)
+            elif isinstance(aux_return.value, ast.Call):   # Calls to a Model method?
+                name = aux_return.value.func.value.value.id
+                name += '.' + aux_return.value.func.value.attr
+                name += '.' + aux_return.value.func.attr
+            elif isinstance(aux_return.value, ast.Constant):   # Constant value?
+                name = "unnamed_" + str(aux_return.value.value)
+            elif isinstance(aux_return.value, ast.Attribute):  # Attribute?
+                name = aux_return.value.value.id
+                name += '.' + aux_return.value.attr
+            if name is not None:
+                return_value_names.append(name)
+                return_value_types.append(node.returns.id)
+                get_return_value_sample(name, class_name, node.returns.id, node.name, is_not_a_model, data)
+
+    # Name, Type, From, To, IsAnArgument, IsAMethod, IsAReturnValue, DefaultValue, PossibleValues, BelongsTo, ClassName
+    # and UsedByView, followed by the names and types of the arguments/return values.
+
+    data.add(node.name, _type, float_min, float_max, False, True, False, '', '', '', class_name, is_not_a_model,
+             argument_names, argument_types, return_value_names, return_value_types)
+
+class Constraint:
+    """
+    Values that an argument can take according to the assertions of its method: the interval of an int or float
+    argument, or the enumeration of values of an str argument (used instead of the interval if there is one).
+    """
+
+    __slots__ = ('_from', 'to', 'values')
+
+    def __init__(self, _from=float_min, to=float_max, values=None):
+        self._from = _from
+        self.to = to
+        self.values = values
+
+    def intersect(self, other):
+        """
+        Returns the constraint satisfied by the values allowed by both constraints (e.g. assert x >= 0 and x <= 10).
 
-    function_sample.append('')  # DefaultValue.
-    function_sample.append('')  # PossibleValues.
-    function_sample.append('')  # BelongsTo.
-    function_sample.append(class_name)  # ClassName.
-    function_sample.append(is_not_a_model)  # UsedByView.
-    return function_sample
+        Param:
+
+        - other (Constraint): The other constraint.
+
+        Return:
+
+        - constraint (Constraint): The merged constraint.
+        """
+        values = self.values if other.values is None else other.values
+        if self.values is not None and other.values is not None:
+            values = [value for value in self.values if value in other.values]
+        return Constraint(max(self._from, other._from), min(self.to, other.to), values)
+
+    def union(self, other):
+        """
+        Returns the constraint satisfied by the values allowed by any of the constraints (e.g. assert x == 'a' or
+        x == 'b').
+
+        Param:
+
+        - other (Constraint): The other constraint.
+
+        Return:
+
+        - constraint (Constraint): The merged constraint.
+        """
+        values = None
+        if self.values is not None and other.values is not None:
+            values = self.values + [value for value in other.values if value not in self.values]
+        return Constraint(min(self._from, other._from), max(self.to, other.to), values)
 
 def look_for_asserts(node):
     """
-    Returns a specific list of assertions to determine the maximum/minimum values
-    of an int or float type argument, or the possible values that an str type argument can take.
+    Parses the assertions of a method once, returning the constraint of each argument involved: the maximum/minimum
+    values of an int or float type argument, or the possible values that an str type argument can take. Chained
+    comparisons (0 <= x <= 10), and/or operations and several assertions on the same argument are merged.
 
     Param:
 
@@ -255,197 +852,150 @@ def look_for_asserts(node):
 
     Return:
 
-    - asserts (list): The list of assertions found inside a method.
-    """
-    asserts = []
-    for _object in node.__dict__['body']:
-        if "Assert" in str(_object):    # Is an assert?
-            _assert = []
-            if 'op' in _object.__dict__['test'].__dict__:   # If its an 'op' object then...
-                for value in _object.__dict__['test'].__dict__['values']:
-                    if 'left' in value.__dict__:
-                        if "Name" in str(value.__dict__['left']):   # Variable name?
-                            _assert.append(value.__dict__['left'].__dict__['id'])
-                        elif "Constant" in str(value.__dict__['left']): # Constant value?
-                            _assert.append(value.__dict__['left'].__dict__['value'])
-                        for ops in value.__dict__['ops']:   # Assign the involved operators
-                            _assert.append(str(ops))
-                        for comparator in value.__dict__['comparators']:    # For the rest of comparators
-                            if "Name" in str(comparator):   # Variable name?
-                                _assert.append(comparator.__dict__['id'])
-                            elif "Constant" in str(comparator): # Constant value?
-                                _assert.append(comparator.__dict__['value'])
-            elif 'left' in _object.__dict__['test'].__dict__: # If its an 'left' object then...
-                if "Name" in str(_object.__dict__['test'].__dict__['left']):    # Variable name?
-                    _assert.append(_object.__dict__['test'].__dict__['left'].__dict__['id'])
-                elif "Constant" in str(_object.__dict__['test'].__dict__['left']):  # Constant value?
-                    _assert.append(_object.__dict__['test'].__dict__['left'].__dict__['value'])
-                elif "UnaryOp" in str(_object.__dict__['test'].__dict__['left']):
-                    if "USub" in str(_object.__dict__['test'].__dict__['left'].__dict__['op']): # Is it negative?
-                        # Constant value?
-                        if "Constant" in str(_object.__dict__['test'].__dict__['left'].__dict__['operand']):
-                            _assert.append(-_object.__dict__['test'].__dict__['left'].__dict__['operand'].__dict__['value'])
-                for ops in _object.__dict__['test'].__dict__['ops']:
-                    _assert.append(str(ops))
-                for comparator in _object.__dict__['test'].__dict__['comparators']: # For the rest of comparators
-                    if "Name" in str(comparator):   # Variable name?
-                        _assert.append(comparator.__dict__['id'])
-                    elif "Constant" in str(comparator): # Constant value?
-                        _assert.append(comparator.__dict__['value'])
-                    elif "List" in str(comparator): # Does it use a list of strings to check for equality?
-                        for constant in _object.__dict__['test'].__dict__['comparators'][0].__dict__['elts']:
-                            _assert.append(constant.__dict__['value'])
-                    elif "UnaryOp" in str(comparator):
-                        if "USub" in str(comparator.__dict__['op']):    # Is it negative?
-                            if "Constant" in str(comparator.__dict__['operand']):
-                                _assert.append(-comparator.__dict__['operand'].__dict__['value'])
-            asserts.append(_assert)
-    return asserts
-
-def get_argument_sample(node, class_name, default_value, asserts, method_name, is_not_a_model):
-    """
-    Adds the sample of the argument which current node corresponds.
+    - constraints (dict): The constraint of each argument, indexed by its name.
+    """
+    constraints = {}
+    for _object in node.body:
+        if isinstance(_object, ast.Assert):    # Is an assert?
+            for name, constraint in get_constraints(_object.test).items():
+                constraints[name] = constraints[name].intersect(constraint) if name in constraints else constraint
+    return constraints
+
+def get_constraints(test):
+    """
+    Returns the constraints of the arguments involved in the condition of an assertion.
+
+    Param:
+
+    - test (ast.expr): The condition of the assertion.
+
+    Return:
+
+    - constraints (dict): The constraint of each argument, indexed by its name.
+    """
+    constraints = {}
+    if isinstance(test, ast.BoolOp):   # If it is a boolean operation (and/or) then...
+        alternatives = [get_constraints(value) for value in test.values]
+        if isinstance(test.op, ast.And):    # Every condition must hold.
+            for alternative in alternatives:
+                for name, constraint in alternative.items():
+                    constraints[name] = constraints[name].intersect(constraint) if name in constraints else constraint
+        else:   # Any condition may hold, so only the arguments constrained by all of them remain constrained.
+            for name in set.intersection(*[set(alternative) for alternative in alternatives]):
+                constraints[name] = alternatives[0][name]
+                for alternative in alternatives[1:]:
+                    constraints[name] = constraints[name].union(alternative[name])
+    elif isinstance(test, ast.Compare): # If it is a (possibly chained) comparison then...
+        operands = [test.left] + test.comparators
+        for left, op, right in zip(operands, test.ops, operands[1:]):
+            comparison = get_comparison_constraint(left, op, right)
+            if comparison is not None:
+                name, constraint = comparison
+                constraints[name] = constraints[name].intersect(constraint) if name in constraints else constraint
+    return constraints
+
+def get_comparison_constraint(left, op, right):
+    """
+    Returns the constraint of the argument involved in a single comparison between an argument and constant values.
+
+    Param:
+
+    - left (ast.expr): The left operand.
+    - op (ast.cmpop): The operator.
+    - right (ast.expr): The right operand.
+
+    Return:
+
+    - comparison (tuple): The name of the argument and its constraint (None if it is not a supported comparison).
+    """
+    if isinstance(left, ast.Name) and isinstance(op, ast.In):   # Does it use a list of values to check for equality?
+        if isinstance(right, (ast.List, ast.Tuple, ast.Set)):
+            values = [get_constant(element) for element in right.elts]
+            if all(found for found, _ in values):
+                return left.id, Constraint(values=[value for _, value in values])
+        return None
+    if isinstance(right, ast.Name) and not isinstance(left, ast.Name):  # Constant on the left side (e.g. 0 < x)?
+        left, right = right, left
+        op = {ast.Lt: ast.Gt(), ast.LtE: ast.GtE(), ast.Gt: ast.Lt(), ast.GtE: ast.LtE()}.get(type(op), op)
+    found, value = get_constant(right)
+    if not isinstance(left, ast.Name) or not found:
+        return None
+    if isinstance(op, ast.Eq):
+        return left.id, Constraint(values=[value])
+    if not isinstance(value, (int, float)): # Only numbers define an interval.
+        return None
+    if isinstance(op, ast.Gt):
+        return left.id, Constraint(_from=float(value) + min_value(type(value)))
+    if isinstance(op, ast.GtE):
+        return left.id, Constraint(_from=float(value))
+    if isinstance(op, ast.Lt):
+        return left.id, Constraint(to=float(value) - min_value(type(value)))
+    if isinstance(op, ast.LtE):
+        return left.id, Constraint(to=float(value))
+    return None
+
+def get_constant(node):
+    """
+    Returns the value of a constant node (including negative numbers).
+
+    Param:
+
+    - node (ast.expr): A node of the syntax tree.
+
+    Return:
+
+    - found (bool): Indicates whether the node is a constant.
+    - value (int/float/bool/complex/str): The value of the constant (None if it is not a constant).
+    """
+    if isinstance(node, ast.Constant):  # Constant value?
+        return True, node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub): # Is it negative?
+        if isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, (int, float)):
+            return True, -node.operand.value
+    return False, None
+
+def get_argument_sample(node, class_name, default_value, constraints, method_name, is_not_a_model, data):
+    """
+    Adds the sample of the argument which current node corresponds to the sample buffer.
 
     Param:
 
     - node (ast.Module): A node of the syntax tree.
     - class_name (str): The name of the class in which the current node is located.
     - default_value (int/float/bool/complex/str/list/tuple/set/dict): The default value of the argument.
-    - asserts (list): The list of assertions found in the method which the argument is passed as a parameter.
+    - constraints (dict): The constraints of the arguments of the method which the argument is passed as a parameter.
     - method_name (str): The name of the method which the argument is passed as a parameter.
     - is_not_a_model (bool): Indicates if the class in which the current node is located is not a Model.
-
-    Return:
-
-    - argument_sample (list): List of sample characteristics of the corresponding argument.
+    - data (SampleBatch): The sample buffer of the scanning session.
     """
-    argument_sample = [node.__dict__['arg']]    # Name
 
     # If it is an argument that includes a default value, the data type of the default value must be obtained without
     # considering type hints.
 
     if default_value:
-        argument_sample.append(type(default_value).__name__)
+        _type = type(default_value).__name__
     else:
-        argument_sample.append(node.__dict__['annotation'].__dict__['id'])
-
-    # Finds the assertion where one of its comparators corresponds to the argument.
-
-    _assert = []
-    i = 0
-    found = False
-    while i < len(asserts) and not found:
-        if node.__dict__['arg'] in asserts[i]:
-            if (("Gt" in asserts[i][1] or "Lt" in asserts[i][1])
-                    and node.__dict__['arg'] in asserts[i]): # Has at least >, >=, <, <= operands in both sides?
-                _assert = asserts[i]
-                found = True
-            elif ("Eq" in asserts[i][1] and node.__dict__['arg'] == asserts[i][0] # Has == operand?
-                  and (node.__dict__['arg'] == asserts[i][0] or node.__dict__['arg'] == asserts[i][1]
-                       or node.__dict__['arg'] == asserts[i][2])):
-                _assert = asserts[i]
-                found = True
-            elif "In" in asserts[i][1] and node.__dict__['arg'] == asserts[i][0]: # Has in operand?
-                _assert = asserts[i]
-                found = True
-            else:
-                i += 1
-        else:
-            i += 1
+        _type = node.annotation.id
+
+    # The constraint of the argument is looked up in the index built from the assertions of the method.
+
+    constraint = constraints.get(node.arg)
     possible_values = ''
-    if len(_assert) == 0:   # If there is no assertion or association with any argument, it keeps From and To default values.
-        argument_sample.append(float_min)
-        argument_sample.append(float_max)
-    elif len(_assert) == 3:
-        if _assert.index(node.__dict__['arg']) == 0:    # If uses one operand (int, float).
-            if "Gt " in _assert[1]:
-                argument_sample.append(float(_assert[2]) + min_value(type(_assert[2])))
-                argument_sample.append(float_max)
-            elif "GtE " in _assert[1]:
-                argument_sample.append(float(_assert[2]))
-                argument_sample.append(float_max)
-            elif "Lt " in _assert[1]:
-                argument_sample.append(float_min)
-                argument_sample.append(float(_assert[2]) - min_value(type(_assert[2])))
-            elif "LtE " in _assert[1]:
-                argument_sample.append(float_min)
-                argument_sample.append(float(_assert[2]))
-        else:
-            if "Gt " in _assert[1]:
-                argument_sample.append(float_min)
-                argument_sample.append(float(_assert[0]) - min_value(type(_assert[0])))
-            elif "GtE " in _assert[1]:
-                argument_sample.append(float_min)
-                argument_sample.append(float(_assert[0]))
-            elif "Lt " in _assert[1]:
-                argument_sample.append(float(_assert[0]) + min_value(type(_assert[0])))
-                argument_sample.append(float_max)
-            elif "LtE " in _assert[1]:
-                argument_sample.append(float(_assert[0]))
-                argument_sample.append(float_max)
-    elif len(_assert) >= 4:
-        if "Gt" in _assert[1] or "Lt" in _assert[1]:    # If uses two operands (int, float).
-            if "Gt " in _assert[1] and "Gt " in _assert[2]:
-                argument_sample.append(float(_assert[-1]) + min_value(type(_assert[-1])))
-                argument_sample.append(float(_assert[0]) - min_value(type(_assert[0])))
-            elif "Gt " in _assert[1] and "GtE " in _assert[2]:
-                argument_sample.append(float(_assert[-1]))
-                argument_sample.append(float(_assert[0]) - min_value(type(_assert[0])))
-            elif "GtE " in _assert[1] and "Gt " in _assert[2]:
-                argument_sample.append(float(_assert[-1]) + min_value(type(_assert[-1])))
-                argument_sample.append(float(_assert[0]))
-            elif "GtE " in _assert[1] and "GtE " in _assert[2]:
-                argument_sample.append(float(_assert[-1]))
-                argument_sample.append(float(_assert[0]))
-            elif "Lt " in _assert[1] and "Lt " in _assert[2]:
-                argument_sample.append(float(_assert[0]) + min_value(type(_assert[0])))
-                argument_sample.append(float(_assert[-1]) - min_value(type(_assert[-1])))
-            elif "Lt " in _assert[1] and "LtE " in _assert[2]:
-                argument_sample.append(float(_assert[0]) + min_value(type(_assert[0])))
-                argument_sample.append(float(_assert[-1]))
-            elif "LtE " in _assert[1] and "Lt " in _assert[2]:
-                argument_sample.append(float(_assert[0]))
-                argument_sample.append(float(_assert[-1]) - min_value(type(_assert[-1])))
-            elif "LtE " in _assert[1] and "LtE " in _assert[2]:
-                argument_sample.append(float(_assert[0]))
-                argument_sample.append(float(_assert[-1]))
-        elif "Eq" in _assert[1]:    # If uses equal operand (str).
-            argument_sample.append(float(0))
-            argument_sample.append(float(_assert.count(node.__dict__['arg'])))
-            for i in range(2, len(_assert), 3):
-                possible_values += str(_assert[i])
-                if i < len(_assert) - 1:
-                    possible_values += ','
-        elif "In" in _assert[1]:    # If uses in operand (str).
-            argument_sample.append(float(0))
-            argument_sample.append(float(len(_assert) - 2))
-            for i in range(2, len(_assert)):
-                possible_values += str(_assert[i])
-                if i < len(_assert) - 1:
-                    possible_values += ','
-
-    argument_sample.append(True)    # IsAnArgument.
-    argument_sample.append(False)   # IsAMethod.
-    argument_sample.append(False)   # IsAReturnValue.
-
-    # Argument/Return value names and types are assigned as blank.
-
-    for i in range(20):
-        argument_sample.append('')
-        argument_sample.append('None')
+    _from = float_min   # If there is no assertion associated with the argument, it keeps From and To default values.
+    to = float_max
+    if constraint is not None:
+        if constraint.values is not None:   # If uses equal/in operands (str).
+            _from = float(0)
+            to = float(len(constraint.values))
+            possible_values = ','.join(str(value) for value in constraint.values)
+        else:   # If uses >, >=, <, <= operands (int, float).
+            _from = constraint._from
+            to = constraint.to
 
     # If a default value exists, it is assigned to DefaultValue.
 
-    if default_value is None:
-        argument_sample.append('')
-    else:
-        argument_sample.append(default_value)
-
-    argument_sample.append(possible_values) # PossibleValues.
-    argument_sample.append(method_name) # BelongsTo.
-    argument_sample.append(class_name)  # ClassName.
-    argument_sample.append(is_not_a_model)  # UsedByView.
-    return argument_sample
+    data.add(node.arg, _type, _from, to, True, False, False, '' if default_value is None else default_value,
+             possible_values, method_name, class_name, is_not_a_model)
 
 def min_value(_type):
     """
@@ -466,9 +1016,9 @@ def min_value(_type):
         value = sys.float_info.epsilon
     return value
 
-def get_return_value_sample(name, class_name, _type, method_name, is_not_a_model):
+def get_return_value_sample(name, class_name, _type, method_name, is_not_a_model, data):
     """
-    Adds the sample of the return value which current node corresponds.
+    Adds the sample of the return value which current node corresponds to the sample buffer.
 
     Param:
 
@@ -477,25 +1027,6 @@ def get_return_value_sample(name, class_name, _type, method_name, is_not_a_model
     - _type (¿?): The data type of the associated value.
     - method_name (str): The name of the method which the argument is passed as a parameter.
     - is_not_a_model (bool): Indicates if the class in which the current node is located is not a Model.
-
-    Return:
-
-    - return_sample (list): List of sample characteristics of the corresponding return value.
+    - data (SampleBatch): The sample buffer of the scanning session.
     """
-
-    # Name, Type, From, To, IsAnArgument, IsAMethod, IsAReturnValue.
-
-    return_sample = [name, _type, float_min, float_max, False, False, True]
-
-    # Argument/Return value names and types are assigned as blank.
-
-    for i in range(20):
-        return_sample.append('')
-        return_sample.append('None')
-
-    return_sample.append('')    # DefaultValue.
-    return_sample.append('')    # PossibleValues.
-    return_sample.append(method_name)   # BelongsTo.
-    return_sample.append(class_name)    # ClassName.
-    return_sample.append(is_not_a_model)    # UsedByView.
-    return return_sample
\ No newline at end of file
+    data.add(name, _type, float_min, float_max, False, False, True, '', '', method_name, class_name, is_not_a_model)